@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 10:44:08 2026
+
+@author: yoelr
+"""
+from free_properties import FreeProperty, PropertyFactory
+from .common import sizes, make_weight_class, make_properties
+
+# %% Scalar magic methods
+
+generic_add = FreeProperty.__add__
+generic_lt = FreeProperty.__lt__
+generic_float = FreeProperty.__float__
+
+class TimeMagicMethods:
+    """Compare magic methods specialized by metaProperty against the generic
+    FreeProperty methods and plain float arithmetic. The 'stored' getter
+    does no work, so it isolates the cost of dispatch."""
+    params = ['stored', 'weight']
+    param_names = ['getter']
+    number = 100000
+    
+    def setup(self, kind):
+        self.a, self.b = make_properties(kind)
+        self.x = 3000.
+        self.y = 2367.
+    
+    def time_add_float(self, kind):
+        self.x + self.y
+    
+    def time_add_generic(self, kind):
+        generic_add(self.a, self.b)
+    
+    def time_add_specialized(self, kind):
+        self.a + self.b
+    
+    def time_add_scalar_generic(self, kind):
+        generic_add(self.a, self.y)
+    
+    def time_add_scalar_specialized(self, kind):
+        self.a + self.y
+    
+    def time_mul_scalar(self, kind):
+        self.a * self.y
+    
+    def time_rsub_scalar(self, kind):
+        self.y - self.a
+    
+    def time_lt_generic(self, kind):
+        generic_lt(self.a, self.b)
+    
+    def time_lt_specialized(self, kind):
+        self.a < self.b
+    
+    def time_eq_scalar(self, kind):
+        self.a == self.y
+    
+    def time_float_generic(self, kind):
+        generic_float(self.a)
+    
+    def time_float_specialized(self, kind):
+        float(self.a)
+    
+    def time_value(self, kind):
+        self.a.value
+    
+    def time_iadd_specialized(self, kind):
+        self.a += 1.
+
+
+# %% Class creation and instance construction
+
+def getter(self):
+    data = self.data
+    return data['rho'] * data['vol']
+
+def setter(self, weight):
+    data = self.data
+    data['vol'] = weight / data['rho']
+
+class TimePropertyFactory:
+    """Creation of FreeProperty classes with the PropertyFactory (repeated
+    calls with the same arguments return the interned class)."""
+    
+    def time_create_class(self):
+        PropertyFactory(getter, setter, 'Weight', units='kg')
+    
+    def time_create_class_not_interned(self):
+        PropertyFactory(getter, setter, 'Weight', units='kg', intern=False)
+    
+    def time_create_class_decorator(self):
+        make_weight_class()
+
+
+class TimeConstruction:
+    """Construction of FreeProperty instances one by one and in bulk."""
+    params = sizes
+    param_names = ['size']
+    
+    def setup(self, size):
+        self.Weight = make_weight_class()
+        self.names = [f'Weight {i}' for i in range(size)]
+        self.datas = [{'rho': 1000., 'vol': 3.} for i in range(size)]
+    
+    def time_init_positional(self, size):
+        Weight = self.Weight
+        [Weight(i, j) for i, j in zip(self.names, self.datas)]
+    
+    def time_init_keyword(self, size):
+        Weight = self.Weight
+        [Weight(name=i, data=j) for i, j in zip(self.names, self.datas)]
+    
+    def time_from_columns(self, size):
+        self.Weight.from_columns(self.names, self.datas)
+    
+    def time_from_columns_array(self, size):
+        self.Weight.from_columns(self.names, self.datas, array=True)
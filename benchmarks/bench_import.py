@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 11:03:52 2026
+
+@author: yoelr
+"""
+import os
+import sys
+import subprocess
+
+# %% Import time
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def run_python(code):
+    return subprocess.check_output([sys.executable, '-c', code], cwd=root)
+
+class TimeImport:
+    """Import time of the package in a fresh interpreter (including the
+    interpreter startup, which is timed alone for reference). Importing the
+    scalar API must not import NumPy."""
+    number = 1
+
+    def setup(self):
+        imported = run_python("import sys, free_properties; print('numpy' in sys.modules)")
+        if imported.strip() != b'False':
+            raise RuntimeError('importing free_properties must not import numpy')
+
+    def time_interpreter(self):
+        run_python("pass")
+
+    def time_import(self):
+        run_python("import free_properties")
+
+    def time_import_property_array(self):
+        run_python("from free_properties import property_array")
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 10:47:02 2026
+
+@author: yoelr
+"""
+import numpy as np
+from free_properties import property_array, ColumnStore, column_data, batch
+from .common import sizes, make_weight_class, make_weights
+
+# %% Property arrays
+
+def weight_many(weights):
+    data = column_data(weights)
+    return data['rho'] * data['vol']
+
+def weight_set_many(weights, values):
+    data = column_data(weights)
+    data['vol'] = values / data['rho']
+
+class TimePropertyArray:
+    """Construction, evaluation, indexing and setting of property_array
+    objects. Properties either hold a dictionary of data and are evaluated
+    one by one ('dict'), or point into a ColumnStore object and are evaluated
+    with batch getters and setters ('columns')."""
+    params = [sizes, ['dict', 'columns']]
+    param_names = ['size', 'data']
+    
+    def setup(self, size, data):
+        if data == 'dict':
+            Weight = make_weight_class()
+            self.properties = make_weights(Weight, size)
+        elif data == 'columns':
+            Weight = make_weight_class(fget_many=weight_many,
+                                       fset_many=weight_set_many)
+            store = ColumnStore(rho=1000. + np.arange(size), vol=np.full(size, 3.))
+            self.properties = [Weight(f'Weight {i}', j) 
+                               for i, j in enumerate(store.rows())]
+        else:
+            raise NotImplementedError(data)
+        self.array = property_array(self.properties)
+        self.fancy_index = np.arange(0, size, 2)
+        self.mask = np.arange(size) % 3 == 0
+        self.values = np.full(size, 3000.)
+    
+    def time_construction(self, size, data):
+        property_array(self.properties)
+    
+    def time_value(self, size, data):
+        self.array.value
+    
+    def time_sum(self, size, data):
+        self.array.sum()
+    
+    def time_mean(self, size, data):
+        self.array.mean()
+    
+    def time_max(self, size, data):
+        self.array.max()
+    
+    def time_argsort(self, size, data):
+        self.array.argsort()
+    
+    def time_add(self, size, data):
+        self.array + 1.
+    
+    def time_getitem_scalar(self, size, data):
+        self.array[0]
+    
+    def time_getitem_slice(self, size, data):
+        self.array[::2]
+    
+    def time_getitem_fancy(self, size, data):
+        self.array[self.fancy_index]
+    
+    def time_getitem_mask(self, size, data):
+        self.array[self.mask]
+    
+    def time_setitem_scalar(self, size, data):
+        self.array[:] = 3000.
+    
+    def time_setitem_array(self, size, data):
+        self.array[:] = self.values
+    
+    def time_setitem_fancy(self, size, data):
+        self.array[self.fancy_index] = 3000.
+    
+    def time_iadd(self, size, data):
+        self.array += 1.
+    
+    def time_index_names(self, size, data):
+        property_array(self.properties).index('Weight 0')
+    
+    def time_loc_scalar(self, size, data):
+        self.array.loc['Weight 0']
+    
+    def time_loc_setitem(self, size, data):
+        self.array.loc[['Weight 0', 'Weight 1']] = 3000.
+    
+    def time_contains_name(self, size, data):
+        'Weight 1' in self.array
+
+
+class TimeBatch:
+    """Setting each property of a property_array twice, one by one and
+    within a transaction (which applies only the last writes in one pass,
+    with batch setters for 'columns'). Transactions buffer each write, so
+    this measures their overhead rather than a speedup."""
+    params = [sizes, ['dict', 'columns']]
+    param_names = ['size', 'data']
+    
+    def setup(self, size, data):
+        TimePropertyArray.setup(self, size, data)
+        self.Weight = type(self.properties[0])
+    
+    def set_twice(self):
+        array = self.array
+        for i in range(len(array)):
+            array[i] = 3000.
+            array[i] = 4000.
+    
+    def time_set(self, size, data):
+        self.set_twice()
+    
+    def time_set_batch(self, size, data):
+        with batch(self.Weight):
+            self.set_twice()
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 10:46:40 2026
+
+@author: yoelr
+"""
+from free_properties import PropertyFactory
+
+__all__ = ('sizes', 'make_weight_class', 'make_stored_class',
+           'make_properties', 'make_weights')
+
+#: Number of elements used by size-parameterized benchmarks.
+sizes = [10, 1000, 100000, 1000000]
+
+# %% Property classes
+
+def make_weight_class(**kwargs):
+    @PropertyFactory(units='kg', **kwargs)
+    def Weight(self):
+        data = self.data
+        return data['rho'] * data['vol']
+    
+    @Weight.setter
+    def Weight(self, weight):
+        data = self.data
+        data['vol'] = weight / data['rho']
+    
+    return Weight
+
+def make_stored_class():
+    @PropertyFactory
+    def Stored(self):
+        return self.data
+    
+    @Stored.setter
+    def Stored(self, value):
+        self.data = value
+    
+    return Stored
+
+def make_properties(kind):
+    if kind == 'weight':
+        Weight = make_weight_class()
+        return (Weight('Water', {'rho': 1000., 'vol': 3.}),
+                Weight('Ethanol', {'rho': 789., 'vol': 3.}))
+    elif kind == 'stored':
+        Stored = make_stored_class()
+        return Stored('Water', 3000.), Stored('Ethanol', 2367.)
+    else:
+        raise ValueError(f'unknown property kind {repr(kind)}')
+
+def make_weights(Weight, size):
+    return [Weight(f'Weight {i}', {'rho': 1000. + i, 'vol': 3.})
+            for i in range(size)]
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 10:47:25 2026
+
+@author: yoelr
+
+Run the benchmark suite offline and store results as JSON.
+
+Benchmarks follow the conventions of airspeed velocity (asv): modules named
+``bench_*.py`` hold classes with ``time_*`` methods, optional ``setup`` and
+``teardown`` methods, and optional ``params``/``param_names`` attributes.
+A ``setup`` method may raise NotImplementedError to skip a parameter
+combination.
+
+Examples
+--------
+Run all benchmarks and save the results::
+
+    $ python -m benchmarks.run -o results/0.3.6.json
+
+Run only property_array benchmarks of 1000 elements::
+
+    $ python -m benchmarks.run -b TimePropertyArray --size 1000
+
+Compare two result files (exits with 1 if any benchmark slowed down by more
+than the given factor)::
+
+    $ python -m benchmarks.run --compare results/0.3.5.json results/0.3.6.json
+
+"""
+import os
+import re
+import sys
+import json
+import time
+import timeit
+import platform
+import argparse
+import importlib
+from itertools import product
+
+__all__ = ('discover', 'run', 'compare')
+
+# %% Discovery
+
+def discover(pattern=None):
+    """Return a list of (name, class, method name) tuples of all benchmarks
+    with names matching the `pattern` regular expression."""
+    directory = os.path.dirname(os.path.abspath(__file__))
+    benchmarks = []
+    for filename in sorted(os.listdir(directory)):
+        if not (filename.startswith('bench_') and filename.endswith('.py')): continue
+        module_name = filename[:-3]
+        module = importlib.import_module(f'{__package__}.{module_name}')
+        for cls_name, cls in vars(module).items():
+            if not (isinstance(cls, type) and cls.__module__ == module.__name__): continue
+            for method_name in sorted(vars(cls)):
+                if not method_name.startswith('time_'): continue
+                name = f'{module_name}.{cls_name}.{method_name}'
+                if pattern and not re.search(pattern, name): continue
+                benchmarks.append((name, cls, method_name))
+    return benchmarks
+
+def parameter_combinations(cls):
+    """Return the parameter names and combinations of a benchmark class."""
+    params = getattr(cls, 'params', None)
+    param_names = list(getattr(cls, 'param_names', ()))
+    if params is None: return param_names, [()]
+    if len(param_names) > 1: return param_names, list(product(*params))
+    return param_names, [(i,) for i in params]
+
+
+# %% Timing
+
+def time_benchmark(cls, method_name, args, repeat, min_time):
+    """Return the best time (in seconds) of a benchmark call, or None if
+    the benchmark was skipped."""
+    benchmark = cls()
+    setup = getattr(benchmark, 'setup', None)
+    teardown = getattr(benchmark, 'teardown', None)
+    try:
+        if setup: setup(*args)
+    except NotImplementedError:
+        return None
+    try:
+        method = getattr(benchmark, method_name)
+        timer = timeit.Timer(lambda: method(*args))
+        number = getattr(cls, 'number', 0)
+        if not number:
+            number = 1
+            while True:
+                seconds = timer.timeit(number)
+                if seconds >= min_time: break
+                number *= 10 if seconds < min_time / 10 else 2
+        return min(timer.repeat(repeat, number)) / number
+    finally:
+        if teardown: teardown(*args)
+
+def run(pattern=None, repeat=3, min_time=0.1, size=None, verbose=True):
+    """Run benchmarks and return a dictionary of results."""
+    results = {}
+    for name, cls, method_name in discover(pattern):
+        param_names, combinations = parameter_combinations(cls)
+        if size is not None and 'size' in param_names:
+            position = param_names.index('size')
+            combinations = [i for i in combinations if i[position] == size]
+        seconds = []
+        for args in combinations:
+            result = time_benchmark(cls, method_name, args, repeat, min_time)
+            seconds.append(result)
+            if verbose:
+                label = ', '.join([repr(i) for i in args])
+                time_str = 'skipped' if result is None else format_time(result)
+                print(f"{name}({label}): {time_str}", flush=True)
+        results[name] = {'param_names': param_names,
+                         'params': [list(i) for i in combinations],
+                         'seconds': seconds}
+    return results
+
+def format_time(seconds):
+    for units, factor in (('s', 1), ('ms', 1e3), ('us', 1e6)):
+        if seconds * factor >= 1: return f'{seconds * factor:.3g} {units}'
+    return f'{seconds * 1e9:.3g} ns'
+
+def environment():
+    """Return a dictionary describing the benchmarking environment."""
+    import numpy
+    import free_properties
+    return {'free_properties': free_properties.__version__,
+            'numpy': numpy.__version__,
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'platform': platform.platform(),
+            'date': time.strftime('%Y-%m-%dT%H:%M:%S')}
+
+
+# %% Comparison
+
+def compare(old, new, factor=1.2, file=sys.stdout):
+    """Print the ratio of new to old times of benchmarks in two result
+    dictionaries and return a list of names of benchmarks that slowed down
+    by more than `factor`."""
+    regressions = []
+    old_results = old['results']
+    for name, result in new['results'].items():
+        if name not in old_results: continue
+        old_times = dict(zip(map(tuple, old_results[name]['params']),
+                             old_results[name]['seconds']))
+        for args, seconds in zip(result['params'], result['seconds']):
+            old_seconds = old_times.get(tuple(args))
+            if seconds is None or not old_seconds: continue
+            ratio = seconds / old_seconds
+            label = f"{name}({', '.join([repr(i) for i in args])})"
+            flag = ''
+            if ratio > factor:
+                flag = '  <-- slower'
+                regressions.append(label)
+            elif ratio < 1 / factor:
+                flag = '  <-- faster'
+            print(f"{ratio:6.2f}  {format_time(old_seconds):>9} -> "
+                  f"{format_time(seconds):>9}  {label}{flag}", file=file)
+    return regressions
+
+
+# %% Command line interface
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.run',
+                                     description='Run the free_properties benchmark suite.')
+    parser.add_argument('-b', '--bench', help='regular expression of benchmarks to run')
+    parser.add_argument('-o', '--output', help='JSON file to store results')
+    parser.add_argument('--repeat', type=int, default=3, help='number of timing repeats')
+    parser.add_argument('--min-time', type=float, default=0.1,
+                        help='minimum duration (s) of each timing repeat')
+    parser.add_argument('--size', type=int, help='only run sizes equal to this value')
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'),
+                        help='compare two JSON result files instead of running')
+    parser.add_argument('--factor', type=float, default=1.2,
+                        help='slow-down ratio considered a regression')
+    args = parser.parse_args(argv)
+    if args.compare:
+        old, new = [json.load(open(i)) for i in args.compare]
+        return 1 if compare(old, new, args.factor) else 0
+    results = run(args.bench, args.repeat, args.min_time, args.size)
+    if args.output:
+        directory = os.path.dirname(args.output)
+        if directory: os.makedirs(directory, exist_ok=True)
+        with open(args.output, 'w') as file:
+            json.dump({**environment(), 'results': results}, file, indent=1)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
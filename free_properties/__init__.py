@@ -5,10 +5,43 @@ Created on Fri Jan 18 14:20:29 2019
 @author: Guest Group
 """
 
-__all__ = ('FreeProperty' , 'PropertyFactory', 'property_array')
+__all__ = ('FreeProperty' , 'PropertyFactory', 'property_array', 'data_changed',
+           'ColumnStore', 'ColumnRow', 'ColumnSelection', 'StoredProperties',
+           'column_data', 'Expression', 'Variable', 'Operation', 'lazy',
+           'CompiledExpression', 'BufferProperty', 'PropertyTable',
+           'SharedArray', 'Profiler', 'trace', 'Tracer', 'Evaluation',
+           'frozen', 'FrozenScope', 'batch', 'Transaction')
 
-from ._free_property import FreeProperty
+from ._free_property import FreeProperty, data_changed
 from ._property_factory import PropertyFactory
-from ._property_array import property_array
+from ._expression import Expression, Variable, Operation, lazy
+from ._profiling import Profiler
+from ._tracing import trace, Tracer, Evaluation
+from ._frozen import frozen, FrozenScope
+from ._transaction import batch, Transaction
+
+# Objects that depend on NumPy are imported on first access, so that the
+# scalar API (FreeProperty, PropertyFactory) does not import NumPy.
+lazy_modules = {'property_array': '_property_array',
+                'ColumnStore': '_column_store',
+                'ColumnRow': '_column_store',
+                'ColumnSelection': '_column_store',
+                'StoredProperties': '_column_store',
+                'column_data': '_column_store',
+                'CompiledExpression': '_compiled_expression',
+                'BufferProperty': '_buffer_property',
+                'PropertyTable': '_property_table',
+                'SharedArray': '_shared_memory'}
+
+def __getattr__(name):
+    if name not in lazy_modules:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    obj = getattr(import_module(f'.{lazy_modules[name]}', __name__), name)
+    globals()[name] = obj
+    return obj
+
+def __dir__():
+    return sorted({*globals(), *__all__})
 
 __version__ = '0.3.6'
\ No newline at end of file
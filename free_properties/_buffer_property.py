@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 10:52:48 2026
+
+@author: yoelr
+"""
+import numpy as np
+from ._free_property import FreeProperty
+
+__all__ = ('BufferProperty',)
+
+# %% Buffer properties
+
+def buffer_indices(properties):
+    """Return the shared buffer and an array of (non-negative) indices of
+    BufferProperty objects, or (None, None) if they do not share a buffer."""
+    size = len(properties)
+    if not size: return None, None
+    buffer = getattr(properties[0], 'buffer', None)
+    if buffer is None: return None, None
+    for i in properties:
+        if not isinstance(i, BufferProperty) or i.buffer is not buffer:
+            return None, None
+    index = np.fromiter([i.index for i in properties], int, size)
+    index[index < 0] += buffer.size
+    return buffer, index
+
+def buffer_view(properties):
+    """Return a (strided) view of the shared buffer of an object array of
+    BufferProperty objects, or None if their indices are not evenly spaced
+    in a single buffer."""
+    buffer, index = buffer_indices(properties.ravel())
+    if buffer is None: return None
+    size = index.size
+    start = index[0]
+    step = index[1] - start if size > 1 else 1
+    if not step or (index != start + step * np.arange(size)).any(): return None
+    return buffer[start::step][:size].reshape(properties.shape)
+
+def get_many(properties):
+    buffer, index = buffer_indices(properties)
+    if buffer is None: return np.array([i.value for i in properties], float)
+    return buffer[index]
+
+def set_many(properties, values):
+    buffer, index = buffer_indices(properties)
+    if buffer is None:
+        for i, j in zip(properties, values): i.value = j
+    else:
+        buffer[index] = values
+
+def get_value(self):
+    return self.buffer.item(self.index)
+
+def set_value(self, value):
+    self.buffer[self.index] = value
+
+class BufferProperty(FreeProperty):
+    """
+    Create a FreeProperty object whose value is an element of a shared
+    float64 buffer (e.g. a column of an array or a memory-mapped file).
+    A property_array of BufferProperty objects with evenly spaced indices
+    in the same buffer exposes its value as a view of the buffer, without
+    copying.
+
+    Parameters
+    ----------
+        name : str
+        buffer : ndarray[float]
+            One-dimensional array holding the value.
+        index : int
+            Position of the value in the buffer.
+
+    Examples
+    --------
+    Create mass properties of a column of an array:
+
+    .. code-block:: python
+
+        >>> import numpy as np
+        >>> from free_properties import BufferProperty, property_array
+        >>> class Mass(BufferProperty):
+        ...     _units = 'kg'
+        >>>
+        >>> data = np.array([[1000., 3.], [789., 3.]])
+        >>> masses = data[:, 0]
+        >>> mass_water = Mass('Water', masses, 0)
+        >>> mass_ethanol = Mass('Ethanol', masses, 1)
+        >>> mass_water
+        <Water: 1000 kg>
+
+    The value of a property_array is a view of the column, and setting
+    items writes to the column directly:
+
+    .. code-block:: python
+
+        >>> prop_arr = property_array([mass_water, mass_ethanol])
+        >>> prop_arr.shared
+        True
+        >>> prop_arr.value.base is data
+        True
+        >>> prop_arr[:] = [2000, 1578]
+        >>> data
+        array([[2000.,    3.],
+               [1578.,    3.]])
+
+    .. Note::
+
+       Writing to the buffer directly (instead of through properties or
+       property arrays) does not invalidate snapshots of property arrays.
+       Use `data_changed` in such cases.
+
+    """
+    __slots__ = ('name', 'buffer', 'index')
+    _fget_many = get_many
+    _fset_many = set_many
+
+    def __init__(self, name, buffer, index):
+        self.name = name
+        self.buffer = buffer
+        self.index = index
+
+    value = property(get_value, set_value)
@@ -0,0 +1,371 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 09:12:40 2026
+
+@author: yoelr
+"""
+import os
+import json
+import numpy as np
+from collections.abc import MutableMapping, Sequence
+from ._property_array import property_array
+from ._shared_memory import SharedArray
+
+__all__ = ('ColumnStore', 'ColumnRow', 'ColumnSelection', 'StoredProperties',
+           'column_data')
+
+# %% Column data
+
+class ColumnStore:
+    """
+    Create a columnar data store of named float64 columns held in contiguous
+    arrays, with one row per property instance. FreeProperty objects point
+    into the store by row (see ColumnRow), so data of many properties is
+    held in a few flat arrays instead of one dictionary per object.
+
+    Parameters
+    ----------
+        **columns : array_like
+            Data of each column. All columns must have the same length.
+
+    Examples
+    --------
+    Create a store with density and volume columns and point new Weight
+    objects into it:
+
+    .. code-block:: python
+
+        >>> from free_properties import PropertyFactory, ColumnStore, column_data
+        >>> @PropertyFactory(units='kg')
+        >>> def Weight(self):
+        ...    '''Weight (kg) based on volume (m^3).'''
+        ...    data = self.data
+        ...    return data['rho'] * data['vol']
+        >>>
+        >>> store = ColumnStore(rho=[1000, 789], vol=[3, 3])
+        >>> weight_water = Weight('Water', store.row(0))
+        >>> weight_ethanol = Weight('Ethanol', store.row(1))
+        >>> weight_water
+        <Water: 3000 kg>
+        >>> weight_water.data
+        {'rho': 1000.0, 'vol': 3.0}
+
+    Batch getters and setters can be expressed as column arithmetic:
+
+    .. code-block:: python
+
+        >>> @Weight.getter_many
+        >>> def Weight(weights):
+        ...    data = column_data(weights)
+        ...    return data['rho'] * data['vol']
+        >>>
+        >>> @Weight.setter_many
+        >>> def Weight(weights, values):
+        ...    data = column_data(weights)
+        ...    data['vol'] = values / data['rho']
+
+    Rows can be appended as needed:
+
+    .. code-block:: python
+
+        >>> weight_glycerol = Weight('Glycerol', store.append(rho=1260, vol=2))
+        >>> store['vol']
+        array([3., 3., 2.])
+
+    Stores can be saved to a directory and memory-mapped back, so that
+    loading takes constant time regardless of the number of rows. Properties
+    of loaded rows are created on demand:
+
+    .. code-block:: python
+
+        >>> store.save('weights', names=['Water', 'Ethanol', 'Glycerol'])
+        >>> store = ColumnStore.load('weights', mmap_mode='r')
+        >>> weights = store.properties(Weight)
+        >>> weights[2]
+        <Glycerol: 2520 kg>
+        >>> weights[:2].value
+        array([3000., 2367.])
+
+    """
+    __slots__ = ('_columns', '_size', '_names', '_shared')
+
+    def __init__(self, **columns):
+        self._columns = {i: np.array(j, float).ravel() for i, j in columns.items()}
+        sizes = {i.size for i in self._columns.values()}
+        if len(sizes) > 1:
+            raise ValueError('all columns must have the same length')
+        self._size = sizes.pop() if sizes else 0
+        self._names = None
+        self._shared = None
+
+    @classmethod
+    def load(cls, directory, mmap_mode='r'):
+        """
+        Return a ColumnStore object with columns saved in `directory` (see
+        `ColumnStore.save`). Columns are memory-mapped according to
+        `mmap_mode`: 'r' for read-only, 'c' for copy-on-write (changes are
+        not saved), 'r+' for read and write, or None to load into memory.
+        """
+        with open(os.path.join(directory, 'header.json')) as file:
+            header = json.load(file)
+        self = cls.__new__(cls)
+        self._columns = {key: np.load(os.path.join(directory, filename), mmap_mode)
+                         for key, filename in header['columns'].items()}
+        self._size = header['size']
+        names = header['names']
+        self._names = names and np.load(os.path.join(directory, names), mmap_mode)
+        self._shared = None
+        return self
+
+    def save(self, directory, names=None):
+        """Save columns (and names of rows, if given) to `directory` as .npy
+        files that can be memory-mapped with `ColumnStore.load`."""
+        os.makedirs(directory, exist_ok=True)
+        size = self._size
+        columns = {}
+        for i, (key, column) in enumerate(self._columns.items()):
+            columns[key] = filename = f'column_{i}.npy'
+            np.save(os.path.join(directory, filename), column[:size])
+        if names is None: names = self._names
+        if names is not None:
+            names = np.asarray(names, str)
+            if names.shape != (size,):
+                raise ValueError(f'expected {size} names; got {names.size}')
+            np.save(os.path.join(directory, 'names.npy'), names)
+        header = {'size': size, 'columns': columns,
+                  'names': None if names is None else 'names.npy'}
+        with open(os.path.join(directory, 'header.json'), 'w') as file:
+            json.dump(header, file, indent=1)
+
+    def share(self):
+        """Return a ColumnStore object with a copy of the columns in shared
+        memory. The store (and properties with its rows as data) is sent to
+        other processes without copying columns, and values set in any
+        process are seen by all. Call `unlink` once all processes are done."""
+        shared = {i: SharedArray(self[i]) for i in self._columns}
+        return rebuild_store(shared, self._size, self._names)
+
+    def unlink(self):
+        """Request the shared memory of columns to be freed (see `share`)."""
+        if self._shared:
+            for i in self._shared.values(): i.unlink()
+
+    def __reduce__(self):
+        size = self._size
+        shared = self._shared or {}
+        columns = {}
+        for key, column in self._columns.items():
+            shared_column = shared.get(key)
+            if shared_column is not None and shared_column.array is column:
+                columns[key] = shared_column
+            else:
+                columns[key] = column[:size]
+        return (rebuild_store, (columns, size, self._names))
+
+    @property
+    def names(self):
+        """[ndarray or None] Names of rows loaded with the store, if any."""
+        return self._names
+
+    def properties(self, cls, names=None):
+        """Return a StoredProperties object of `cls` instances with data
+        rows of the store, created on demand. Names of instances default
+        to the names loaded with the store (or row numbers)."""
+        return StoredProperties(cls, self, self._names if names is None else names)
+
+    @property
+    def size(self):
+        """[int] Number of rows."""
+        return self._size
+
+    def keys(self):
+        return self._columns.keys()
+
+    def row(self, index):
+        """Return a ColumnRow object pointing to the row at `index`."""
+        if not -self._size <= index < self._size:
+            raise IndexError(f'row index {index} is out of bounds for size {self._size}')
+        if index < 0: index += self._size
+        return ColumnRow(self, index)
+
+    def rows(self):
+        """Return a list of ColumnRow objects for all rows."""
+        return [ColumnRow(self, i) for i in range(self._size)]
+
+    def append(self, **values):
+        """Append a row and return a ColumnRow object pointing to it.
+        Columns not given are set to NaN."""
+        for i in values:
+            if i not in self._columns:
+                raise KeyError(f'no column named {repr(i)}')
+        size = self._size
+        columns = self._columns
+        for key, column in columns.items():
+            if column.size == size:
+                column = columns[key] = np.resize(column, max(2*size, 8))
+            column[size] = values.get(key, np.nan)
+        self._size = size + 1
+        return ColumnRow(self, size)
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, key):
+        return key in self._columns
+
+    def __getitem__(self, key):
+        return self._columns[key][:self._size]
+
+    def __setitem__(self, key, values):
+        columns = self._columns
+        if key in columns:
+            columns[key][:self._size] = values
+        else:
+            column = np.empty(max([i.size for i in columns.values()], default=0))
+            column[:self._size] = values
+            columns[key] = column
+
+    def __repr__(self):
+        return f"<{type(self).__name__}: {', '.join(self._columns)} ({self._size} rows)>"
+
+
+def rebuild_store(columns, size, names):
+    self = ColumnStore.__new__(ColumnStore)
+    self._shared = {i: j for i, j in columns.items() if isinstance(j, SharedArray)}
+    self._columns = {i: j.array if isinstance(j, SharedArray) else j
+                     for i, j in columns.items()}
+    self._size = size
+    self._names = names
+    return self
+
+
+class ColumnRow(MutableMapping):
+    """
+    Create a mapping of column names to values of a row of a ColumnStore
+    object. ColumnRow objects can be used wherever a data dictionary is
+    expected (e.g. as the `data` of a FreeProperty).
+
+    Parameters
+    ----------
+        store : ColumnStore
+        index : int
+
+    """
+    __slots__ = ('store', 'index')
+
+    def __init__(self, store, index):
+        self.store = store
+        self.index = index
+
+    def __getitem__(self, key):
+        return self.store._columns[key].item(self.index)
+
+    def __setitem__(self, key, value):
+        self.store._columns[key][self.index] = value
+
+    def __delitem__(self, key):
+        raise TypeError('cannot delete columns of a ColumnRow object')
+
+    def __iter__(self):
+        return iter(self.store._columns)
+
+    def __len__(self):
+        return len(self.store._columns)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class ColumnSelection:
+    """
+    Create a mapping of column names to arrays of values of selected rows
+    of a ColumnStore object. Getting a column gathers the values of the
+    rows; setting a column writes values back into the store.
+
+    Parameters
+    ----------
+        store : ColumnStore
+        index : array_like[int]
+
+    """
+    __slots__ = ('store', 'index')
+
+    def __init__(self, store, index):
+        self.store = store
+        self.index = np.asarray(index, int)
+
+    def keys(self):
+        return self.store._columns.keys()
+
+    def __getitem__(self, key):
+        return self.store._columns[key][self.index]
+
+    def __setitem__(self, key, values):
+        self.store._columns[key][self.index] = values
+
+    def __len__(self):
+        return self.index.size
+
+    def __repr__(self):
+        return f"<{type(self).__name__}: {', '.join(self.store._columns)} ({self.index.size} rows)>"
+
+
+class StoredProperties(Sequence):
+    """
+    Create a sequence of FreeProperty objects of a given class with data
+    rows of a ColumnStore object. Properties are only created when
+    accessed, so creating the sequence takes constant time. Indexing with
+    slices or arrays of indices returns a property_array object.
+
+    Parameters
+    ----------
+        cls : FreeProperty subclass
+        store : ColumnStore
+        names : Sequence[str], optional
+            Names of properties. Defaults to row numbers.
+
+    """
+    __slots__ = ('cls', 'store', 'names')
+
+    def __init__(self, cls, store, names=None):
+        self.cls = cls
+        self.store = store
+        self.names = names
+
+    def _new(self, index):
+        names = self.names
+        name = str(index) if names is None else str(names[index])
+        return self.cls(name, ColumnRow(self.store, index))
+
+    def __getitem__(self, index):
+        size = self.store._size
+        if isinstance(index, slice):
+            index = range(*index.indices(size))
+        elif not isinstance(index, (list, np.ndarray)):
+            index = int(index)
+            if not -size <= index < size:
+                raise IndexError(f'index {index} is out of bounds for size {size}')
+            return self._new(index + size if index < 0 else index)
+        else:
+            index = np.arange(size)[index]
+        properties = np.empty(len(index), object)
+        for i, j in enumerate(index): properties[i] = self._new(int(j))
+        return property_array(properties)
+
+    def __len__(self):
+        return self.store._size
+
+    def __repr__(self):
+        return f"<{type(self).__name__}: {self.cls.__name__} ({len(self)} rows)>"
+
+
+def column_data(properties):
+    """Return a ColumnSelection object of the data rows of properties. The
+    data of all properties must be ColumnRow objects of the same store."""
+    rows = [i.data for i in properties]
+    if not rows: return ColumnSelection(ColumnStore(), ())
+    store = getattr(rows[0], 'store', None)
+    for i in rows:
+        if not isinstance(i, ColumnRow) or i.store is not store:
+            raise ValueError('data of all properties must be rows of the same ColumnStore object')
+    return ColumnSelection(store, np.fromiter([i.index for i in rows], int, len(rows)))
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 10:50:31 2026
+
+@author: yoelr
+"""
+import operator as op
+import numpy as np
+
+__all__ = ('CompiledExpression',)
+
+# %% Compiled expressions
+
+ufuncs = {op.add: np.add, op.sub: np.subtract, op.mul: np.multiply,
+          op.truediv: np.true_divide, op.floordiv: np.floor_divide,
+          op.mod: np.remainder, op.pow: np.power, op.neg: np.negative,
+          op.pos: np.positive, op.abs: np.absolute}
+
+class CompiledExpression:
+    """
+    Create a compiled version of an Expression object over property_array
+    (and FreeProperty) objects. Each operation is executed as a NumPy ufunc
+    writing into an output buffer preallocated at compile time, and buffers
+    of intermediate results are reused once no longer needed, so repeated
+    evaluation allocates no temporaries beyond those of property getters.
+
+    Parameters
+    ----------
+        expression : Expression
+
+    Examples
+    --------
+    Define a derived quantity over property arrays:
+
+    .. code-block:: python
+
+        >>> from free_properties import PropertyFactory, property_array, lazy
+        >>> @PropertyFactory(units='kg')
+        >>> def Weight(self):
+        ...    data = self.data
+        ...    return data['rho'] * data['vol']
+        >>>
+        >>> @PropertyFactory(units='USD/kg')
+        >>> def Price(self):
+        ...    return self.data['price']
+        >>>
+        >>> water_data = {'rho': 1000, 'vol': 3, 'price': 0.01}
+        >>> ethanol_data = {'rho': 789, 'vol': 3, 'price': 0.5}
+        >>> weights = property_array([Weight('Water', water_data),
+        ...                           Weight('Ethanol', ethanol_data)])
+        >>> prices = property_array([Price('Water', water_data),
+        ...                          Price('Ethanol', ethanol_data)])
+        >>> cost = (lazy(weights) * prices + 10).compile()
+        >>> cost()
+        array([  40. , 1193.5])
+
+    Reevaluate after data changes:
+
+    .. code-block:: python
+
+        >>> water_data['vol'] = 4
+        >>> cost()
+        array([  50. , 1193.5])
+
+    .. Note::
+
+       The returned array is the output buffer of the compiled expression
+       and is overwritten on every call. Pass `out` or copy it to keep it.
+
+    """
+    __slots__ = ('expression', 'shape', '_instructions', '_slots', '_buffers')
+
+    def __init__(self, expression):
+        program = expression.program
+        size = len(program)
+        last_use = list(range(size))
+        for i, (source, operator, operands) in enumerate(program):
+            for is_node, j in operands:
+                if is_node: last_use[j] = i
+        last_use[-1] = size # Final result is never released
+        shapes = []
+        slots = [None] * size
+        free_buffers = {}
+        buffers = []
+        instructions = []
+        for i, (source, operator, operands) in enumerate(program):
+            if operator is None:
+                shapes.append(tuple(getattr(source, 'shape', ())))
+                instructions.append((i, source, None, None))
+                continue
+            shape = np.broadcast_shapes(*[shapes[j] if is_node else np.shape(j)
+                                          for is_node, j in operands])
+            shapes.append(shape)
+            released = {j for is_node, j in operands
+                        if is_node and last_use[j] == i and slots[j] is not None}
+            for j in released: free_buffers.setdefault(shapes[j], []).append(slots[j])
+            if shape:
+                if operator not in ufuncs:
+                    raise ValueError(f'cannot compile {operator} as a ufunc')
+                pool = free_buffers.get(shape)
+                if pool:
+                    buffer = pool.pop()
+                else:
+                    buffer = np.empty(shape)
+                    buffers.append(buffer)
+                slots[i] = buffer
+                instructions.append((i, ufuncs[operator], buffer, operands))
+            else:
+                instructions.append((i, operator, None, operands))
+        self.expression = expression
+        self.shape = shapes[-1]
+        self._instructions = instructions
+        self._slots = slots
+        self._buffers = buffers
+
+    @property
+    def nbuffers(self):
+        """[int] Number of preallocated buffers."""
+        return len(self._buffers)
+
+    def __call__(self, out=None):
+        """Evaluate the expression and return the result. If `out` is given,
+        the result is copied into it."""
+        slots = self._slots
+        for i, function, buffer, operands in self._instructions:
+            if operands is None: # Variable
+                slots[i] = function.value
+                continue
+            args = [slots[k] if is_node else k for is_node, k in operands]
+            if buffer is None:
+                slots[i] = function(*args)
+            else:
+                function(*args, out=buffer)
+        result = slots[-1]
+        if out is None: return result
+        np.copyto(out, result)
+        return out
+
+    def __repr__(self):
+        return f'<{type(self).__name__}: {self.expression._infix()}>'
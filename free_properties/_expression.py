@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 10:48:37 2026
+
+@author: yoelr
+"""
+import operator as op
+from weakref import WeakValueDictionary
+from ._free_property import defer_operations
+
+__all__ = ('Expression', 'Variable', 'Operation', 'lazy')
+
+# %% Expression nodes
+
+#: Interned nodes by structural key, so that equal subexpressions are the
+#: same node (common-subexpression elimination).
+nodes = WeakValueDictionary()
+
+def constant_key(value):
+    try:
+        return ('constant', type(value), value, hash(value))
+    except TypeError:
+        return ('constant', id(value))
+
+def key_of(obj):
+    # Nodes are interned, so their identity stands for their structure
+    return id(obj) if isinstance(obj, Expression) else constant_key(obj)
+
+def as_operand(obj):
+    if isinstance(obj, Expression): return obj
+    elif hasattr(obj, 'value'): return Variable(obj)
+    else: return obj
+
+symbols = {op.add: '+', op.sub: '-', op.mul: '*', op.truediv: '/',
+           op.floordiv: '//', op.mod: '%', op.pow: '**', op.matmul: '@',
+           op.neg: '-', op.pos: '+', op.abs: 'abs'}
+
+class Expression:
+    """
+    Abstract class for nodes of deferred arithmetic between FreeProperty
+    objects. Arithmetic on expressions returns new expressions, and equal
+    subexpressions are the same node. Evaluating an expression evaluates
+    each underlying property (and subexpression) at most once.
+
+    Examples
+    --------
+    Use `lazy` to start an expression from a property:
+
+    .. code-block:: python
+
+        >>> from free_properties import PropertyFactory, lazy
+        >>> @PropertyFactory(units='kg')
+        >>> def Weight(self):
+        ...    data = self.data
+        ...    return data['rho'] * data['vol']
+        >>>
+        >>> water_data = {'rho': 1000, 'vol': 3}
+        >>> weight_water = Weight('Water', water_data)
+        >>> weight_ethanol = Weight('Ethanol', {'rho': 789, 'vol': 3})
+        >>> total = lazy(weight_water) + weight_ethanol
+        >>> expr = total * 2 - total / 2
+        >>> expr
+        <Expression: (Water + Ethanol) * 2 - (Water + Ethanol) / 2>
+        >>> expr.evaluate()
+        8050.5
+
+    Expressions can be reevaluated after data changes:
+
+    .. code-block:: python
+
+        >>> water_data['vol'] = 4
+        >>> expr.evaluate()
+        9550.5
+
+    """
+    __slots__ = ('_program', '__weakref__')
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        defer_operations(cls)
+
+    def __new__(cls, *args):
+        raise TypeError("use 'lazy' to create expressions")
+
+    @classmethod
+    def _intern(cls, key, **fields):
+        self = nodes.get(key)
+        if self is None:
+            self = object.__new__(cls)
+            self._program = None
+            for i, j in fields.items(): setattr(self, i, j)
+            nodes[key] = self
+        return self
+
+    def _compile(self):
+        """Return a list of (source, operator, operands) evaluation steps in
+        topological order, with one step per unique node."""
+        positions = {}
+        program = []
+        stack = [(self, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if node in positions: continue
+            if isinstance(node, Variable):
+                positions[node] = len(program)
+                program.append((node.source, None, ()))
+            elif expanded:
+                operands = tuple([(True, positions[i]) if isinstance(i, Expression)
+                                  else (False, i) for i in node.operands])
+                positions[node] = len(program)
+                program.append((None, node.operator, operands))
+            else:
+                stack.append((node, True))
+                for i in reversed(node.operands):
+                    if isinstance(i, Expression) and i not in positions:
+                        stack.append((i, False))
+        return program
+
+    @property
+    def program(self):
+        """[list] Evaluation steps in topological order."""
+        program = self._program
+        if program is None: self._program = program = self._compile()
+        return program
+
+    @property
+    def variables(self):
+        """[list] Sources of all variables in the expression."""
+        return [i for i, j, k in self.program if j is None]
+
+    def compile(self):
+        """Return a CompiledExpression object that evaluates the expression
+        as a pipeline of NumPy ufuncs with preallocated output buffers."""
+        from ._compiled_expression import CompiledExpression
+        return CompiledExpression(self)
+
+    def evaluate(self):
+        """Return the value of the expression."""
+        results = []
+        append = results.append
+        for source, operator, operands in self.program:
+            if operator is None:
+                append(source.value)
+            else:
+                append(operator(*[results[j] if i else j for i, j in operands]))
+        return results[-1]
+
+    @property
+    def value(self):
+        return self.evaluate()
+
+    def __float__(self):
+        return float(self.evaluate())
+
+    def __add__(self, other):
+        return Operation.new(op.add, self, other)
+
+    def __sub__(self, other):
+        return Operation.new(op.sub, self, other)
+
+    def __mul__(self, other):
+        return Operation.new(op.mul, self, other)
+
+    def __matmul__(self, other):
+        return Operation.new(op.matmul, self, other)
+
+    def __truediv__(self, other):
+        return Operation.new(op.truediv, self, other)
+
+    def __floordiv__(self, other):
+        return Operation.new(op.floordiv, self, other)
+
+    def __mod__(self, other):
+        return Operation.new(op.mod, self, other)
+
+    def __pow__(self, other):
+        return Operation.new(op.pow, self, other)
+
+    def __radd__(self, other):
+        return Operation.new(op.add, other, self)
+
+    def __rsub__(self, other):
+        return Operation.new(op.sub, other, self)
+
+    def __rmul__(self, other):
+        return Operation.new(op.mul, other, self)
+
+    def __rmatmul__(self, other):
+        return Operation.new(op.matmul, other, self)
+
+    def __rtruediv__(self, other):
+        return Operation.new(op.truediv, other, self)
+
+    def __rfloordiv__(self, other):
+        return Operation.new(op.floordiv, other, self)
+
+    def __rmod__(self, other):
+        return Operation.new(op.mod, other, self)
+
+    def __rpow__(self, other):
+        return Operation.new(op.pow, other, self)
+
+    def __neg__(self):
+        return Operation.new(op.neg, self)
+
+    def __pos__(self):
+        return Operation.new(op.pos, self)
+
+    def __abs__(self):
+        return Operation.new(op.abs, self)
+
+    def __repr__(self):
+        return f'<{Expression.__name__}: {self._infix()}>'
+
+
+class Variable(Expression):
+    """Leaf of an expression that evaluates to the value of its source
+    (e.g. a FreeProperty object)."""
+    __slots__ = ('source',)
+
+    def __new__(cls, source):
+        return cls._intern(('variable', id(source)), source=source)
+
+    def _infix(self, precedence=0):
+        return str(getattr(self.source, 'name', self.source))
+
+
+precedences = {op.add: 1, op.sub: 1, op.mul: 2, op.truediv: 2, op.floordiv: 2,
+               op.mod: 2, op.matmul: 2, op.neg: 3, op.pos: 3, op.pow: 4}
+
+class Operation(Expression):
+    """Node of an expression that applies an operator to its operands."""
+    __slots__ = ('operator', 'operands')
+
+    @classmethod
+    def new(cls, operator, *operands):
+        operands = tuple([as_operand(i) for i in operands])
+        key = (operator, *[key_of(i) for i in operands])
+        return cls._intern(key, operator=operator, operands=operands)
+
+    def _infix(self, precedence=0):
+        operator = self.operator
+        symbol = symbols.get(operator, getattr(operator, '__name__', repr(operator)))
+        operands = self.operands
+        if operator not in precedences:
+            args = ', '.join([i._infix() if isinstance(i, Expression) else repr(i)
+                              for i in operands])
+            return f'{symbol}({args})'
+        own = precedences[operator]
+        if len(operands) == 1:
+            inner = (own,)
+        elif operator is op.pow: # Right associative
+            inner = (own + 1, own)
+        else:
+            inner = (own, own + 1)
+        strings = [i._infix(j) if isinstance(i, Expression) else repr(i)
+                   for i, j in zip(operands, inner)]
+        string = (symbol + strings[0]) if len(strings) == 1 else f' {symbol} '.join(strings)
+        return f'({string})' if own < precedence else string
+
+
+defer_operations(Expression)
+
+def lazy(obj):
+    """Return a Variable expression that evaluates to the value of `obj`
+    (e.g. a FreeProperty object). Arithmetic on the variable (including
+    arithmetic with FreeProperty objects on either side) is deferred until
+    the resulting expression is evaluated."""
+    return Variable(obj)
@@ -4,8 +4,279 @@ Created on Fri Jan 18 14:19:03 2019
 
 @author: Guest Group
 """
+import os
+import sys
+import marshal
+import copyreg
+from types import FunctionType, CellType
+from importlib import import_module
+from collections import namedtuple
+from weakref import finalize, ref, WeakValueDictionary
+from operator import index
+from math import trunc, floor, ceil
+
+__all__ = ('FreeProperty', 'data_changed')
+
+# %% Getter cache
+
+CacheInfo = namedtuple('CacheInfo', ('hits', 'misses'))
+
+def snapshot(value):
+    """Return a copy of `value` if it is mutable (i.e., has a 'copy' method,
+    like arrays, lists, and dictionaries); otherwise return `value`."""
+    copy = getattr(value, 'copy', None)
+    return value if copy is None else copy()
+
+def same_values(values, other_values):
+    """Return whether all values are equal, comparing arrays element-wise."""
+    for a, b in zip(values, other_values):
+        if a is b: continue
+        try:
+            if not a == b: return False
+        except ValueError: # Arrays
+            try:
+                if a.shape != b.shape or not (a == b).all(): return False
+            except Exception:
+                return False
+    return True
+
+def cached_getter(fget, depends):
+    """Return a getter that stores the last value of `fget` in the '_cache'
+    slot of instances. The value is reused until the setter runs, the class
+    cache is cleared, or the data at any of the `depends` keys changes (data
+    is compared to copies of the data at the last evaluation)."""
+    def fget_cached(self):
+        if depends:
+            data = self.data
+            key = [data[i] for i in depends]
+        else:
+            key = None
+        stats = self._cache_stats
+        try:
+            epoch, last_key, value = self._cache
+        except (AttributeError, TypeError):
+            pass
+        else:
+            if epoch == self._cache_epoch and (key is None or same_values(key, last_key)):
+                stats[0] += 1
+                return value
+        stats[1] += 1
+        value = fget(self)
+        if key is not None: key = [snapshot(i) for i in key]
+        self._cache = (self._cache_epoch, key, value)
+        return value
+    fget_cached.__doc__ = fget.__doc__
+    return fget_cached
+
+
+# %% Write version and notifications
+
+#: list[int] Version of FreeProperty data, incremented on every write through
+#: the setter of a 'value' property (or a batch setter). Objects derived
+#: from property values (e.g. property_array snapshots) remain valid while
+#: the version is unchanged.
+write_version = [0]
+
+#: list[weakref] References to objects notified of written properties through
+#: their `_properties_written` method (e.g. incremental property_array
+#: objects). References are removed once their objects are collected.
+write_observers = []
+
+#: list[Transaction] Open transactions. While any transaction is open,
+#: property_array objects read and write values through getters and setters
+#: instead of shared buffers (see BufferProperty).
+open_transactions = []
+
+def observe_writes(obj):
+    """Notify `obj` of written properties until it is garbage collected."""
+    write_observers.append(ref(obj, write_observers.remove))
+
+def unobserve_writes(obj):
+    """Stop notifying `obj` of written properties."""
+    write_observers[:] = [i for i in write_observers if i() is not obj]
+
+def notify_write(properties):
+    """Notify observers that `properties` were written (an empty tuple
+    denotes that any property may have been written)."""
+    for i in write_observers:
+        obj = i()
+        if obj is not None: obj._properties_written(properties)
+
+def data_changed(*properties):
+    """Increment the write version and notify observers that properties
+    were written. Call this after mutating property data outside of
+    setters. If no properties are given, any property may have changed."""
+    write_version[0] += 1
+    if write_observers: notify_write(properties)
+
+def versioned_setter(fset, cached=False):
+    """Return a setter that calls `fset`, increments the write version, and
+    notifies observers. If `cached` is True, the cached value of instances
+    is cleared too."""
+    if cached:
+        def fset_versioned(self, value):
+            self._cache = None
+            fset(self, value)
+            write_version[0] += 1
+            if write_observers: notify_write((self,))
+    else:
+        def fset_versioned(self, value):
+            fset(self, value)
+            write_version[0] += 1
+            if write_observers: notify_write((self,))
+    fset_versioned.__doc__ = fset.__doc__
+    return fset_versioned
+
+#: set[CodeType] Code of setters returned by `versioned_setter`.
+versioned_setter_codes = {versioned_setter(None, i).__code__ for i in (False, True)}
+
+
+# %% Coroutine getters and setters
+
+#: Code flag of coroutine functions (same as inspect.CO_COROUTINE).
+CO_COROUTINE = 0x80
+
+def is_coroutine_function(function):
+    return bool(getattr(getattr(function, '__code__', None), 'co_flags', 0)
+                & CO_COROUTINE)
+
+def run_coroutine(coroutine):
+    """Run a coroutine to completion outside of an event loop."""
+    import asyncio
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    coroutine.close()
+    raise RuntimeError("cannot run coroutine getters or setters synchronously "
+                       "within a running event loop; use 'avalue' or 'aset'")
+
+def synchronous_getter(afget):
+    """Return a getter that runs the coroutine getter `afget` to completion."""
+    def fget(self):
+        return run_coroutine(afget(self))
+    fget.__doc__ = afget.__doc__
+    return fget
+
+def synchronous_setter(afset):
+    """Return a setter that runs the coroutine setter `afset` to completion."""
+    def fset(self, value):
+        run_coroutine(afset(self, value))
+    fset.__doc__ = afset.__doc__
+    return fset
+
+
+# %% Pickling
+
+def is_global(obj):
+    """Return whether `obj` can be pickled by reference (i.e. it is found
+    in its module by its qualified name)."""
+    found = sys.modules.get(getattr(obj, '__module__', None))
+    for name in getattr(obj, '__qualname__', '<locals>').split('.'):
+        found = getattr(found, name, None)
+    return found is obj
+
+class PortableFunction:
+    """Wrap a function so that it is pickled by value (code, defaults, and
+    closure) and unpickled as the function itself, with the globals of its
+    module in the unpickling process."""
+    __slots__ = ('function',)
+    
+    def __init__(self, function):
+        self.function = function
+    
+    def __reduce__(self):
+        f = self.function
+        closure = f.__closure__
+        if closure: closure = tuple([portable(i.cell_contents) for i in closure])
+        return (rebuild_function, (marshal.dumps(f.__code__), f.__module__,
+                                   f.__name__, f.__qualname__, f.__doc__,
+                                   f.__defaults__, f.__kwdefaults__, closure))
+
+def portable(obj):
+    """Return `obj`, wrapped in a PortableFunction object if it is a function
+    that cannot be pickled by reference."""
+    if isa(obj, FunctionType) and not is_global(obj):
+        return PortableFunction(obj)
+    return obj
+
+def rebuild_function(code, module, name, qualname, doc, defaults,
+                     kwdefaults, closure):
+    module = sys.modules.get(module) or import_module(module)
+    if closure: closure = tuple([CellType(i) for i in closure])
+    f = FunctionType(marshal.loads(code), vars(module), name, defaults, closure)
+    f.__qualname__ = qualname
+    f.__doc__ = doc
+    f.__kwdefaults__ = kwdefaults
+    return f
+
+#: dict[tuple, metaProperty] Classes pickled by value (and classes rebuilt by
+#: unpickling) by the process and class they were pickled from, so that each
+#: class is rebuilt at most once.
+rebuilt_classes = WeakValueDictionary()
+
+def reduce_class(cls):
+    arguments = cls.__dict__.get('_factory_arguments')
+    # Classes of the main script may be created in code that other
+    # processes do not run (e.g. under `if __name__ == '__main__'`)
+    if is_global(cls) and (arguments is None or cls.__module__ != '__main__'):
+        return cls.__qualname__
+    elif arguments is None:
+        raise TypeError(f"cannot pickle {cls.__name__} class; it must be "
+                         "importable or created with the PropertyFactory")
+    key = (os.getpid(), id(cls), cls.__qualname__)
+    rebuilt_classes[key] = cls # Unpickled as is by this process (and forks)
+    return (rebuild_class, (key, {i: portable(j) for i, j in arguments.items()}))
+
+def rebuild_class(key, arguments):
+    cls = rebuilt_classes.get(key)
+    if cls is None:
+        from ._property_factory import PropertyFactory
+        rebuilt_classes[key] = cls = PropertyFactory(**arguments)
+    return cls
+
+def rebuild_property(cls, state):
+    self = object.__new__(cls)
+    for i, j in state.items(): setattr(self, i, j)
+    if cls._cached: self._cache = None
+    return self
+
+
+# %% Slot initialization
+
+#: dict[tuple[str], tuple[function, function]] Slot methods by slots.
+slot_methods_cache = {}
+
+def slot_methods(slots):
+    """Return an `__init__` method and a `from_columns` function specialized
+    to `slots`. Public slots are set from arguments (None by default) and
+    private slots (e.g. '_cache') are set to None; special slots (e.g.
+    '__weakref__') are left as is."""
+    slots = tuple(slots)
+    if slots in slot_methods_cache: return slot_methods_cache[slots]
+    public = [i for i in slots if not i.startswith('_')]
+    private = [i for i in slots if i.startswith('_')
+               and not (i.startswith('__') and i.endswith('__'))]
+    body = [f"self.{i} = {i}" for i in public]
+    body += [f"self.{i} = None" for i in private]
+    body = "; ".join(body) or "pass"
+    arguments = ", ".join([f"{i}=None" for i in public])
+    columns = ", ".join(public)
+    source = (f"def __init__(self{', ' if public else ''}{arguments}): {body}\n"
+              f"def from_columns(cls{', ' if public else ''}{columns}):\n"
+              f"    new = object.__new__\n"
+              f"    properties = []\n"
+              f"    append = properties.append\n"
+              f"    for {columns}{',' if public else '_'} in zip({columns}):\n"
+              f"        self = new(cls); {body}\n"
+              f"        append(self)\n"
+              f"    return properties")
+    namespace = {}
+    exec(source, namespace)
+    methods = slot_methods_cache[slots] = (namespace['__init__'],
+                                          namespace['from_columns'])
+    return methods
 
-__all__ = ('FreeProperty',)
 
 # %% Metaclasses
 
@@ -39,34 +310,398 @@ inplace_magic_names = ('__iadd__', '__isub__', '__imul__', '__imatmul__',
                         '__imod__', '__ipow__', '__ilshift__', '__irshift__',
                         '__iand__', '__ixor__', '__ior__')
 
+# Expressions of magic methods in terms of the value; names without an
+# expression keep the generic FreeProperty method.
+self_magic_expressions = {
+    '__len__': 'len({v})', '__float__': 'float({v})', '__invert__': '~{v}',
+    '__complex__': 'complex({v})', '__int__': 'int({v})',
+    '__index__': 'index({v})', '__trunc__': 'trunc({v})',
+    '__floor__': 'floor({v})', '__ceil__': 'ceil({v})',
+    '__reversed__': 'reversed({v})', '__neg__': '-{v}', '__pos__': '+{v}',
+    '__abs__': 'abs({v})', '__bool__': 'bool({v})',
+}
+
+other_magic_expressions = {
+    '__lt__': '{v} < other', '__le__': '{v} <= other',
+    '__eq__': '{v} == other', '__ne__': '{v} != other',
+    '__gt__': '{v} > other', '__ge__': '{v} >= other',
+    '__getitem__': '{v}[other]', '__contains__': 'other in {v}',
+    '__add__': '{v} + other', '__sub__': '{v} - other',
+    '__mul__': '{v} * other', '__matmul__': '{v} @ other',
+    '__truediv__': '{v} / other', '__floordiv__': '{v} // other',
+    '__mod__': '{v} % other', '__divmod__': 'divmod({v}, other)',
+    '__pow__': '{v} ** other', '__lshift__': '{v} << other',
+    '__rshift__': '{v} >> other', '__and__': '{v} & other',
+    '__or__': '{v} | other', '__radd__': 'other + {v}',
+    '__rsub__': 'other - {v}', '__rmul__': 'other * {v}',
+    '__rmatmul__': 'other @ {v}', '__rtruediv__': 'other / {v}',
+    '__rfloordiv__': 'other // {v}', '__rmod__': 'other % {v}',
+    '__rdivmod__': 'divmod(other, {v})', '__rpow__': 'other ** {v}',
+    '__rlshift__': 'other << {v}', '__rrshift__': 'other >> {v}',
+    '__rand__': 'other & {v}', '__rxor__': 'other ^ {v}',
+    '__ror__': 'other | {v}',
+}
+
+inplace_magic_operators = {
+    '__iadd__': '+', '__isub__': '-', '__imul__': '*', '__imatmul__': '@',
+    '__itruediv__': '/', '__ifloordiv__': '//', '__imod__': '%',
+    '__ipow__': '**', '__ilshift__': '<<', '__irshift__': '>>',
+    '__iand__': '&', '__ixor__': '^', '__ior__': '|',
+}
+
+def magic_methods_source():
+    """Return the source of the `magic_methods` function, which creates
+    magic methods specialized to a getter and setter, and of the
+    `wrapped_magic_methods` function, which also wraps the getter and
+    setter of each method (e.g. for profiling)."""
+    value = 'fget(self)'
+    getter_methods = {
+        '__call__': ("(self, *args, **kwargs):\n"
+                     f"        return {value}(*args, **kwargs)"),
+        '__format__': ("(self, format_spec):\n"
+                       f"        return format({value}, format_spec)"),
+        '__round__': ("(self, *args):\n"
+                      f"        return round({value}, *args)"),
+    }
+    for name in self_magic_names + other_magic_names:
+        if name in self_magic_expressions:
+            expression = self_magic_expressions[name].format(v=value)
+            getter_methods[name] = ("(self):\n"
+                                    f"        return {expression}")
+        elif name in other_magic_expressions:
+            expression = other_magic_expressions[name].format(v=value)
+            getter_methods[name] = ("(self, other):\n"
+                                    "        other_cls = other.__class__\n"
+                                    "        if other_cls is cls: other = fget(other)\n"
+                                    "        elif id(other_cls) in class_ids:\n"
+                                    "            if id(other_cls) in deferred_class_ids: return NotImplemented\n"
+                                    "            other = other.value\n"
+                                    f"        return {expression}")
+    setter_methods = {}
+    for name in inplace_magic_names:
+        if name in inplace_magic_operators:
+            operator = inplace_magic_operators[name]
+            setter_methods[name] = ("(self, other):\n"
+                                    "        other_cls = other.__class__\n"
+                                    "        if other_cls is cls: other = fget(other)\n"
+                                    "        elif id(other_cls) in class_ids:\n"
+                                    "            if id(other_cls) in deferred_class_ids: return NotImplemented\n"
+                                    "            other = other.value\n"
+                                    f"        fset(self, {value} {operator} other)\n"
+                                    "        return self")
+    lines = ["def magic_methods(cls, fget, fset, class_ids):",
+             "    methods = {}"]
+    for name, source in getter_methods.items():
+        lines.append(f"    def {name}{source}")
+        lines.append(f"    methods['{name}'] = {name}")
+    lines.append("    if not fset: return methods")
+    for name, source in setter_methods.items():
+        lines.append(f"    def {name}{source}")
+        lines.append(f"    methods['{name}'] = {name}")
+    lines.append("    return methods")
+    # Each method gets its own wrapped getter and setter
+    lines += ["def wrapped_magic_methods(cls, fget, fset, class_ids, wrap):",
+              "    methods = {}"]
+    for name, source in getter_methods.items():
+        lines.append(f"    fget{name} = wrap(fget, 'get', '{name}')")
+        lines.append(f"    def {name}{source.replace('fget(', f'fget{name}(')}")
+        lines.append(f"    methods['{name}'] = {name}")
+    lines.append("    if not fset: return methods")
+    for name, source in setter_methods.items():
+        source = source.replace('fget(', f'fget{name}(').replace('fset(', f'fset{name}(')
+        lines.append(f"    fget{name} = wrap(fget, 'get', '{name}')")
+        lines.append(f"    fset{name} = wrap(fset, 'set', '{name}')")
+        lines.append(f"    def {name}{source}")
+        lines.append(f"    methods['{name}'] = {name}")
+    lines.append("    return methods")
+    return "\n".join(lines)
+
+#: set[int] Ids of classes of operands that defer arithmetic with FreeProperty
+#: objects (e.g. expressions), for which magic methods return NotImplemented.
+deferred_class_ids = set()
+
+namespace = {'index': index, 'trunc': trunc, 'floor': floor, 'ceil': ceil,
+             'deferred_class_ids': deferred_class_ids}
+exec(magic_methods_source(), namespace)
+magic_methods = namespace['magic_methods']
+wrapped_magic_methods = namespace['wrapped_magic_methods']
+del namespace
+magic_method_codes = frozenset([
+    *[i.__code__ for i in magic_methods(None, None, True, None).values()],
+    *[i.__code__ for i in wrapped_magic_methods(None, None, True, None,
+                                                lambda f, kind, name: f).values()]
+])
+magic_method_names = tuple(magic_methods(None, None, True, None))
+inplace_method_names = tuple([i for i in magic_method_names
+                              if i not in magic_methods(None, None, None, None)])
+
+#: set[int] Ids of all FreeProperty classes and classes that defer arithmetic
+#: (a set of ids instead of a set of classes lets unused classes be garbage
+#: collected).
+class_ids = set()
+
+def defer_operations(cls):
+    """Make magic methods of FreeProperty objects return NotImplemented for
+    operands of class `cls`, so that the operation is left to the operand
+    (e.g. to build an expression)."""
+    class_ids.add(id(cls))
+    deferred_class_ids.add(id(cls))
+    finalize(cls, class_ids.discard, id(cls))
+    finalize(cls, deferred_class_ids.discard, id(cls))
+
+#: Placeholder of attributes not defined in the class body before instrumenting.
+uninstrumented = object()
+
 class metaProperty(type):
     """Metaclass for FreeProperty and subclasses."""
     
+    def __init__(cls, name, bases, definitions):
+        super().__init__(name, bases, definitions)
+        class_ids.add(id(cls))
+        finalize(cls, class_ids.discard, id(cls))
+        cls._version_setter()
+        cls._specialize_magic_methods()
+    
+    def __setattr__(cls, name, value):
+        super().__setattr__(name, value)
+        if name == 'value':
+            cls._version_setter()
+            cls._specialize_magic_methods()
+    
+    def _version_setter(cls):
+        """Wrap the setter of the 'value' property (if defined in the class
+        body) so that writes increment the write version and notify
+        observers."""
+        value = cls.__dict__.get('value')
+        if not isa(value, property): return
+        fset = value.fset
+        if not fset or getattr(fset, '__code__', None) in versioned_setter_codes: return
+        type.__setattr__(cls, 'value',
+                         property(value.fget, versioned_setter(fset, cls._cached),
+                                  doc=value.__doc__))
+    
+    def _defines_magic_method(cls, name):
+        """Return whether a magic method is defined by the class or its
+        bases (other than FreeProperty) and not by specialization."""
+        for base in cls.__mro__:
+            if base is FreeProperty: return False
+            definitions = base.__dict__
+            if name in definitions:
+                method = definitions[name]
+                if method is FreeProperty.__dict__.get(name): return False
+                return getattr(method, '__code__', None) not in magic_method_codes
+        return False
+    
+    def _specialize_magic_methods(cls, wrap=None):
+        """Set magic methods specialized to the getter and setter of the
+        'value' property (with the getter inlined), leaving any magic
+        methods defined in the class body (or inherited from bases other
+        than FreeProperty) untouched. In-place magic methods of classes
+        without a setter are the generic ones, which raise an
+        AttributeError. If given, the getter and setter of each method are
+        replaced by `wrap(function, kind, name)`, where kind is 'get' or
+        'set'."""
+        value = cls.__dict__.get('value')
+        if not isa(value, property) or not value.fget: return
+        fget = value.fget
+        fset = value.fset
+        if wrap:
+            methods = wrapped_magic_methods(cls, fget, fset, class_ids, wrap)
+        else:
+            methods = magic_methods(cls, fget, fset, class_ids)
+        if not fset:
+            generic = FreeProperty.__dict__
+            for name in inplace_method_names:
+                if name in generic: methods[name] = generic[name]
+        setattribute = type.__setattr__
+        for name, method in methods.items():
+            if cls._defines_magic_method(name): continue
+            setattribute(cls, name, method)
+    
+    def _instrument(cls, owner, wrap, triggers=True):
+        """Replace the getter and setter of the 'value' property, magic
+        methods, and batch getter and setter by `wrap(function, kind,
+        trigger)`, where kind is 'get', 'set', 'get_many', or 'set_many' and
+        trigger is the name of the method calling the function (e.g. for
+        profiling). If `triggers` is False, the getter and setter are wrapped
+        once for all methods (with None as the trigger), which is faster.
+        Instrumentation may be nested, and is undone by `owner` (e.g. a
+        Profiler object) with `_uninstrument`. Return whether the class was
+        instrumented."""
+        definitions = cls.__dict__
+        value = definitions.get('value')
+        if not isa(value, property) or not value.fget: return False
+        if '_uninstrumented' not in definitions: cls._uninstrumented = []
+        cls._uninstrumented.append(
+            (owner, wrap, triggers,
+             {i: definitions.get(i, uninstrumented)
+              for i in ('value', '_fget_many', '_fset_many', *magic_method_names)})
+        )
+        fset = value.fset
+        if triggers:
+            cls._specialize_magic_methods(wrap)
+            type.__setattr__(cls, 'value',
+                             property(wrap(value.fget, 'get', 'value'),
+                                      fset and wrap(fset, 'set', 'value'),
+                                      doc=value.__doc__))
+        else:
+            type.__setattr__(cls, 'value',
+                             property(wrap(value.fget, 'get', None),
+                                      fset and wrap(fset, 'set', None),
+                                      doc=value.__doc__))
+            cls._specialize_magic_methods()
+        if cls._fget_many: cls._fget_many = wrap(cls._fget_many, 'get_many', 'get_many')
+        if cls._fset_many: cls._fset_many = wrap(cls._fset_many, 'set_many', 'set_many')
+        return True
+    
+    def _uninstrument(cls, owner):
+        """Undo the last instrumentation by `owner`. Instrumentation by other
+        owners done afterwards (if any) is undone and redone on top."""
+        stack = cls.__dict__.get('_uninstrumented')
+        if not stack: return
+        for position in range(len(stack) - 1, -1, -1):
+            if stack[position][0] is owner: break
+        else:
+            return
+        above = stack[position + 1:]
+        definitions = stack[position][3]
+        del stack[position:]
+        if not stack: del cls._uninstrumented
+        for name, definition in definitions.items():
+            if definition is uninstrumented:
+                if name in cls.__dict__: delattr(cls, name)
+            else:
+                type.__setattr__(cls, name, definition)
+        for owner, wrap, triggers, _ in above: cls._instrument(owner, wrap, triggers)
+    
+    def _uninstrumented_value(cls):
+        """Return the 'value' property of the class as it was before any
+        instrumentation."""
+        for base in cls.__mro__:
+            definitions = base.__dict__
+            if 'value' in definitions:
+                stack = definitions.get('_uninstrumented')
+                return stack[0][3]['value'] if stack else definitions['value']
+    
     @property
     def units(cls):
         return cls._units
     
     @units.setter
     def units(cls, units):
+        cls._release()
         cls._units = units
+        cls._update_factory_arguments(units=units)
+    
+    def _release(cls):
+        """Stop returning the class from PropertyFactory calls (before
+        modifying it in place, so that the class of equal calls is not
+        modified)."""
+        key = cls.__dict__.get('_interned_key')
+        if key is None: return
+        from ._property_factory import interned_classes
+        if interned_classes.get(key) is cls: del interned_classes[key]
+        cls._interned_key = None
+    
+    def _update_factory_arguments(cls, **arguments):
+        """Update arguments to rebuild the class with the PropertyFactory
+        (e.g. when unpickling), if any."""
+        factory_arguments = cls.__dict__.get('_factory_arguments')
+        if factory_arguments is not None: factory_arguments.update(arguments)
     
     def getter(cls, fget):
+        cls._release()
+        cls._update_factory_arguments(fget=fget)
+        if is_coroutine_function(fget):
+            cls._afget = fget
+            fget = synchronous_getter(fget)
+        else:
+            cls._afget = None
+        if cls._cached: fget = cached_getter(fget, cls._depends)
         cls.value = cls.value.getter(fget)
         return cls
     
     def setter(cls, fset):
+        cls._release()
+        cls._update_factory_arguments(fset=fset)
+        if is_coroutine_function(fset):
+            cls._afset = fset
+            fset = synchronous_setter(fset)
+        else:
+            cls._afset = None
+        fset = versioned_setter(fset, cls._cached)
         cls.value = cls.value.setter(fset)
         return cls
 
+    def from_columns(cls, *columns, array=False):
+        """Return a list (or a property_array if `array` is True) of new
+        instances with slots set from `columns` (e.g. names and data)."""
+        from_columns = cls.__dict__.get('_from_columns')
+        if from_columns:
+            properties = from_columns(cls, *columns)
+        else:
+            properties = list(map(cls, *columns))
+        if array:
+            from ._property_array import property_array
+            return property_array(properties)
+        return properties
+
+    def getter_many(cls, fget_many):
+        cls._release()
+        cls._update_factory_arguments(fget_many=fget_many)
+        cls._fget_many = fget_many
+        return cls
+
+    def setter_many(cls, fset_many):
+        cls._release()
+        cls._update_factory_arguments(fset_many=fset_many)
+        cls._fset_many = fset_many
+        return cls
+    
+    def cache_info(cls):
+        """Return a CacheInfo object with the number of cache hits and misses
+        of the getter (only for classes created with `cache=True`)."""
+        return CacheInfo(*cls._cache_stats)
+    
+    def cache_clear(cls):
+        """Discard cached values of all instances and reset cache statistics
+        (only for classes created with `cache=True`)."""
+        if not cls._cached: return
+        cls._cache_epoch += 1
+        cls._cache_stats[:] = (0, 0)
+
+
+copyreg.pickle(metaProperty, reduce_class)
+
 
 # %% Abstract Property Class
 
 isa = isinstance
 
 class FreeProperty(metaclass=metaProperty):
-    """Abstract Property class. Child classes must include a 'value' property."""
+    """
+    Abstract Property class. Child classes must include a 'value' property.
+
+    Notes
+    -----
+    Magic methods not defined in the class body (or by a base other than
+    FreeProperty) are specialized to the getter and setter of the 'value'
+    property, and are specialized again when 'value' is set on the class.
+    Specialized reflected methods (e.g. `__radd__`) compute the result with
+    the raw value of the other operand (e.g. `other + self.value`) instead
+    of returning NotImplemented for operands the value does not support.
+
+    """
     __slots__ = ()
     _units = ''
+    _fget_many = None
+    _fset_many = None
+    _afget = None
+    _afset = None
+    _cached = False
+    _depends = ()
+    _cache_epoch = 0
+    _cache_stats = (0, 0)
     
     @property
     def base(self):
@@ -77,6 +712,29 @@ class FreeProperty(metaclass=metaProperty):
         for i, j in zip(self.__slots__, args): setfield(self, i, j)
         for i, j in kwargs.items(): setfield(self, i, j)
     
+    async def avalue(self):
+        """Return the value, awaiting the getter if it is a coroutine."""
+        afget = type(self)._afget
+        return self.value if afget is None else await afget(self)
+    
+    async def aset(self, value):
+        """Set the value, awaiting the setter if it is a coroutine."""
+        afset = type(self)._afset
+        if afset is None:
+            self.value = value
+            return
+        if self._cached: self._cache = None
+        await afset(self, value)
+        write_version[0] += 1
+        if write_observers: notify_write((self,))
+    
+    def __reduce__(self):
+        cls = type(self)
+        state = {i: getattr(self, i) for i in copyreg._slotnames(cls)
+                 if i != '_cache' and hasattr(self, i)}
+        if hasattr(self, '__dict__'): state.update(self.__dict__)
+        return (rebuild_property, (cls, state))
+    
     def __call__(self, *args, **kwargs):
         return self.value(*args, **kwargs)
     
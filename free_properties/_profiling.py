@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 10:57:43 2026
+
+@author: yoelr
+"""
+from time import perf_counter
+from ._free_property import FreeProperty
+
+__all__ = ('Profiler',)
+
+# %% Profiling
+
+def subclasses(cls):
+    """Return a list of all subclasses of `cls`."""
+    classes = []
+    stack = [cls]
+    while stack:
+        for i in stack.pop().__subclasses__():
+            classes.append(i)
+            stack.append(i)
+    return classes
+
+class Profiler:
+    """
+    Create a Profiler object that counts calls and accumulates wall time of
+    getters and setters of FreeProperty classes, along with the methods
+    that triggered them (e.g. 'value', '__add__', or 'get_many' for batch
+    getters). Classes are only instrumented while the profiler is enabled,
+    so profiling has no overhead otherwise.
+
+    Parameters
+    ----------
+        *classes : FreeProperty subclasses
+            Classes to profile. Defaults to all FreeProperty subclasses that
+            exist when the profiler is enabled.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        >>> from free_properties import PropertyFactory, Profiler
+        >>> @PropertyFactory(units='kg')
+        >>> def Weight(self):
+        ...    data = self.data
+        ...    return data['rho'] * data['vol']
+        >>>
+        >>> weight_water = Weight('Water', {'rho': 1000, 'vol': 3})
+        >>> with Profiler(Weight) as profiler:
+        ...     total = weight_water + weight_water.value
+        >>> profiler.report()['__main__.Weight']['get']['triggers']
+        {'__add__': 1, 'value': 1}
+        >>> print(profiler.table())
+        Class              Kind       Calls   Time (s)   Time/call (s)  Triggers
+        __main__.Weight    get            2   2.38e-06        1.19e-06  __add__: 1, value: 1
+
+    .. Note::
+
+       Times are inclusive of properties evaluated within getters and
+       setters. Classes created while the profiler is enabled are not
+       profiled.
+
+    """
+    __slots__ = ('classes', '_records', '_instrumented')
+
+    def __init__(self, *classes):
+        self.classes = classes
+        self._records = {}
+        self._instrumented = []
+
+    @property
+    def enabled(self):
+        """[bool] Whether classes are instrumented."""
+        return bool(self._instrumented)
+
+    def _wrapper(self, cls):
+        records = self._records.setdefault(cls, {})
+        def wrap(function, kind, trigger):
+            record = records.setdefault((kind, trigger), [0, 0.])
+            def timed(*args):
+                start = perf_counter()
+                try:
+                    return function(*args)
+                finally:
+                    record[1] += perf_counter() - start
+                    record[0] += 1
+            timed.__doc__ = function.__doc__
+            return timed
+        return wrap
+
+    def enable(self):
+        """Instrument classes to record calls to getters and setters."""
+        if self._instrumented: return
+        classes = self.classes or subclasses(FreeProperty)
+        for cls in classes:
+            if cls._instrument(self, self._wrapper(cls)): self._instrumented.append(cls)
+
+    def disable(self):
+        """Restore classes to stop recording calls."""
+        for cls in reversed(self._instrumented): cls._uninstrument(self)
+        self._instrumented.clear()
+
+    def clear(self):
+        """Discard all records."""
+        for records in self._records.values():
+            for record in records.values(): record[:] = (0, 0.)
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.disable()
+
+    def report(self):
+        """
+        Return a dictionary of records by class (module and qualified name)
+        and kind of call ('get', 'set', 'get_many', or 'set_many'), with the
+        number of calls, total seconds, and calls by trigger, e.g.:
+        ``{'module.Weight': {'get': {'calls': 2, 'seconds': 2.4e-06,
+        'triggers': {'__add__': 1, 'value': 1}}}}``.
+        """
+        report = {}
+        for cls, records in self._records.items():
+            kinds = {}
+            for (kind, trigger), (calls, seconds) in sorted(records.items()):
+                if not calls: continue
+                if kind in kinds:
+                    stats = kinds[kind]
+                else:
+                    kinds[kind] = stats = {'calls': 0, 'seconds': 0., 'triggers': {}}
+                stats['calls'] += calls
+                stats['seconds'] += seconds
+                stats['triggers'][trigger] = calls
+            if kinds: report[f'{cls.__module__}.{cls.__qualname__}'] = kinds
+        return report
+
+    def table(self):
+        """Return a table of records as a string, with the most time
+        consuming classes and kinds of calls first."""
+        rows = [(name, kind, stats) for name, kinds in self.report().items()
+                for kind, stats in kinds.items()]
+        rows.sort(key=lambda row: row[2]['seconds'], reverse=True)
+        width = max([len(i[0]) for i in rows] + [5]) + 3
+        lines = [f"{'Class':<{width}}{'Kind':<9}{'Calls':>7}{'Time (s)':>11}"
+                 f"{'Time/call (s)':>16}  Triggers"]
+        for name, kind, stats in rows:
+            calls = stats['calls']
+            seconds = stats['seconds']
+            triggers = ', '.join([f'{i}: {j}' for i, j in stats['triggers'].items()])
+            lines.append(f"{name:<{width}}{kind:<9}{calls:>7}{seconds:>11.3g}"
+                         f"{seconds / calls:>16.3g}  {triggers}")
+        return '\n'.join(lines)
+
+    def __repr__(self):
+        return f"<{type(self).__name__}: {'enabled' if self.enabled else 'disabled'}>"
@@ -4,13 +4,133 @@ Created on Thu Jan 10 03:56:02 2019
 
 @author: yoelr
 """
+import os
+import asyncio
 import numpy as np
+from ._free_property import (FreeProperty, write_version, write_observers,
+                             notify_write, observe_writes, open_transactions)
+from ._buffer_property import buffer_view
+from ._shared_memory import SharedArray
 
 __all__ = ('property_array',)
 
 ndarray = np.ndarray
 isa = isinstance
 
+# %% Batch evaluation
+
+def group_by_class(flat):
+    """Return a dictionary of element indices by class for a 1d array."""
+    groups = {}
+    for index, cls in enumerate(map(type, flat)):
+        if cls in groups: groups[cls].append(index)
+        else: groups[cls] = [index]
+    return groups
+
+def get_values(properties):
+    """Return a float array of the values of an object array of properties.
+    Instances of classes with a batch getter are evaluated with a single
+    call per class."""
+    properties = properties.view(ndarray)
+    flat = properties.ravel()
+    classes = set(map(type, flat))
+    fgets_many = {i: i._fget_many for i in classes
+                  if getattr(i, '_fget_many', None)}
+    if not fgets_many:
+        return np.array(properties, float)
+    if len(classes) == 1:
+        fget_many, = fgets_many.values()
+        values = np.asarray(fget_many(flat), float)
+    else:
+        values = np.empty(flat.size)
+        for cls, index in group_by_class(flat).items():
+            group = flat[index]
+            if cls in fgets_many:
+                values[index] = fgets_many[cls](group)
+            else:
+                values[index] = np.array(group, float)
+    return values.reshape(properties.shape)
+
+def set_values(properties, values):
+    """Set the values of an object array of properties. Instances of
+    classes with a batch setter are set with a single call per class."""
+    properties = properties.view(ndarray)
+    flat = properties.ravel()
+    classes = set(map(type, flat))
+    fsets_many = {i: i._fset_many for i in classes
+                  if getattr(i, '_fset_many', None)}
+    if not fsets_many:
+        for i, v in np.nditer((properties, values), flags=('refs_ok', 'zerosize_ok')):
+            i.item().value = v.item()
+        return
+    values = np.broadcast_to(np.asarray(values, float), properties.shape).ravel()
+    if len(classes) == 1:
+        cls, = classes
+        cls._fset_many(flat, values)
+        if cls._cached: cls._cache_epoch += 1
+    else:
+        for cls, index in group_by_class(flat).items():
+            if cls in fsets_many:
+                fsets_many[cls](flat[index], values[index])
+                if cls._cached: cls._cache_epoch += 1
+            else:
+                for i, v in zip(flat[index], values[index]): i.value = v
+    write_version[0] += 1
+    if write_observers: notify_write(flat)
+
+
+async def gather(awaitables, limit=None):
+    """Await all `awaitables` concurrently (at most `limit` at a time) and
+    return a list of results."""
+    if not limit: return await asyncio.gather(*awaitables)
+    semaphore = asyncio.Semaphore(limit)
+    async def limited(awaitable):
+        async with semaphore: return await awaitable
+    return await asyncio.gather(*[limited(i) for i in awaitables])
+
+
+# %% NumPy protocols
+
+def as_values(obj):
+    """Return `obj` with property_array and FreeProperty objects (including
+    those nested in lists and tuples) replaced by their values."""
+    if isa(obj, (property_array, FreeProperty)):
+        return obj.value
+    elif type(obj) in (list, tuple):
+        return type(obj)([as_values(i) for i in obj])
+    else:
+        return obj
+
+#: Functions which modify their first argument in place.
+inplace_functions = {np.copyto, np.put, np.putmask, np.place}
+
+# %% Label-based indexing
+
+class LabelIndexer:
+    """Get and set items of a property_array by property name."""
+    __slots__ = ('array',)
+    
+    def __init__(self, array):
+        self.array = array
+    
+    def _key(self, names):
+        array = self.array
+        if isa(names, str):
+            return array.index(names)
+        positions = np.array([array._position(i) for i in names], int)
+        if array.ndim == 1: return positions
+        return np.unravel_index(positions, array.shape)
+    
+    def __getitem__(self, names):
+        return self.array[self._key(names)]
+    
+    def __setitem__(self, names, value):
+        self.array[self._key(names)] = value
+    
+    def __repr__(self):
+        return f"<{type(self).__name__}: {repr(self.array)}>"
+
+
 # %% Property array
 
 class property_array(ndarray):
@@ -22,6 +142,23 @@ class property_array(ndarray):
     Parameters
     ----------
         properties : array_like[FreeProperty]
+        snapshot : bool, optional
+            Whether to keep a float snapshot of property values that is reused
+            until any property is set. Defaults to False.
+        incremental : bool, optional
+            Whether to keep a float buffer of property values in which only
+            properties set since the last evaluation are reevaluated.
+            Defaults to False.
+    
+    Notes
+    -----
+    Properties are indexed by name the first time they are looked up by
+    name (e.g. with `loc` or `in`), assuming names do not change. Slices
+    share the index of the array they were taken from.
+    
+    If all properties are BufferProperty objects evenly spaced in a single
+    buffer, the value is a view of the buffer and snapshot and incremental
+    modes are not needed (nor used).
     
     Examples
     --------
@@ -94,237 +231,564 @@ class property_array(ndarray):
        >>> water_data #  Data remains unchanged
        {'rho': 1000, 'vol': 6.0}
 
+    Keep a snapshot of values to avoid reevaluating properties in chained
+    calls. The snapshot is reused until a property is set:
+    
+    .. code-block:: python
+    
+       >>> prop_arr = property_array([weight_water, weight_ethanol], snapshot=True)
+       >>> prop_arr.mean(), prop_arr.max() # Properties are evaluated once
+       (4183.5, 6000.0)
+       >>> prop_arr[1] = 2000 # Setting values invalidates the snapshot
+       >>> prop_arr.mean()
+       4000.0
+    
+    Call the `refresh` method after changing data outside of setters:
+        
+    .. code-block:: python
+    
+       >>> water_data['vol'] = 3
+       >>> prop_arr.refresh()
+       >>> prop_arr.mean()
+       2500.0
+    
+    Expensive getters can be evaluated in parallel with a thread or process
+    pool (classes and data must be picklable for process pools):
+    
+    .. code-block:: python
+    
+       >>> from concurrent.futures import ThreadPoolExecutor
+       >>> with ThreadPoolExecutor(4) as executor:
+       ...     values = prop_arr.evaluate(executor)
+       >>> values
+       array([3000., 2000.])
+    
+    NumPy functions and ufuncs operate on property values, and results
+    written to a property_array `out` are set through property setters:
+    
+    .. code-block:: python
+    
+       >>> import numpy as np
+       >>> np.maximum(prop_arr, 2500)
+       array([3000., 2500.])
+       >>> np.multiply(prop_arr, 2, out=prop_arr)
+       property_array([6000, 4000])
+       >>> np.divide(prop_arr, 2, out=prop_arr)
+       property_array([3000, 2000])
+    
+    Properties with coroutine getters (and setters) are evaluated (and set)
+    concurrently with `avalue` (and `aset`):
+    
+    .. code-block:: python
+    
+       >>> import asyncio
+       >>> @PropertyFactory
+       >>> async def RemoteWeight(self):
+       ...    await asyncio.sleep(0.1) # e.g. fetch data from a server
+       ...    return self.data['weight']
+       >>>
+       >>> remote_weights = property_array([RemoteWeight(str(i), {'weight': i})
+       ...                                  for i in range(100)])
+       >>> values = asyncio.run(remote_weights.avalue(limit=50)) # About 0.2 s
+    
+    In incremental mode, only properties set since the last evaluation
+    (through property arrays or the 'value' property of any FreeProperty
+    object) are reevaluated. Use `mark_dirty` (or `data_changed`) after
+    changing data outside of setters:
+    
+    .. code-block:: python
+    
+       >>> from free_properties import data_changed
+       >>> prop_arr = property_array([weight_water, weight_ethanol], incremental=True)
+       >>> prop_arr[0] = 4000 # Only the water weight is reevaluated next
+       >>> prop_arr.value
+       array([4000., 2000.])
+       >>> ethanol_data['vol'] = 3
+       >>> data_changed(weight_ethanol)
+       >>> prop_arr.value
+       array([4000., 2367.])
+    
+    Get and set properties by name through `loc`:
+    
+    .. code-block:: python
+    
+       >>> 'Water' in prop_arr
+       True
+       >>> prop_arr.loc['Water']
+       4000.0
+       >>> prop_arr.loc[['Ethanol', 'Water']] = [2367, 3000]
+       >>> prop_arr.loc[['Water', 'Ethanol']]
+       array([3000., 2367.])
+
     """
-    def __new__(cls, properties):
-        return np.asarray(properties, dtype=object).view(cls)
+    def __new__(cls, properties, snapshot=False, incremental=False):
+        if type(properties) is list and properties and isa(properties[0], FreeProperty):
+            # Avoid probing each property as a sequence
+            properties = np.fromiter(properties, object, len(properties))
+        self = np.asarray(properties, dtype=object).view(cls)
+        self._keep_snapshot = snapshot
+        self._index = None
+        self._shared_view = buffer_view(self.view(ndarray))
+        if self._shared_view is not None: return self
+        if incremental:
+            flat = self.view(ndarray).ravel()
+            positions = {}
+            for position, i in enumerate(flat):
+                key = id(i)
+                if key in positions: positions[key].append(position)
+                else: positions[key] = [position]
+            self._positions = positions
+            self._dirty = set()
+            buffer = get_values(flat)
+            self._buffer = buffer
+            self._buffer_view = buffer.reshape(self.shape)
+            self._buffer_view.flags.writeable = False
+            observe_writes(self)
+        return self
+    
+    def __array_finalize__(self, obj):
+        self._keep_snapshot = getattr(obj, '_keep_snapshot', False)
+        self._snapshot = None
+        self._snapshot_version = None
+        self._positions = None
+        self._shared_view = None
+        self._index = None
+    
+    @property
+    def shared(self):
+        """[bool] Whether the value is a view of a buffer shared by all
+        properties (see BufferProperty)."""
+        return self._shared_view is not None
+    
+    @property
+    def incremental(self):
+        """[bool] Whether only properties set since the last evaluation are
+        reevaluated."""
+        return self._positions is not None
+    
+    def _properties_written(self, properties):
+        if not len(properties):
+            self._dirty.update(range(self._buffer.size))
+            return
+        positions = self._positions
+        dirty = self._dirty
+        for i in properties:
+            key = id(i)
+            if key in positions: dirty.update(positions[key])
+    
+    def mark_dirty(self, index=None):
+        """Mark properties at flat `index` (or all properties) for
+        reevaluation in incremental mode."""
+        if self._positions is None: return
+        if index is None: index = range(self._buffer.size)
+        self._dirty.update(np.arange(self._buffer.size)[index].flat)
+    
+    def _name_index(self):
+        """Return a dictionary of flat positions by property name and the
+        range of positions in the array."""
+        index = self._index
+        if index is None:
+            flat = self.view(ndarray).ravel()
+            positions = {getattr(j, 'name', None): i for i, j in enumerate(flat)}
+            self._index = index = (positions, range(flat.size))
+        return index
+    
+    def _position(self, name):
+        positions, rows = self._name_index()
+        try:
+            return rows.index(positions[name])
+        except (KeyError, ValueError):
+            raise KeyError(f'no property named {repr(name)}') from None
+    
+    def index(self, name):
+        """Return the index of the property with the given name."""
+        position = self._position(name)
+        if self.ndim == 1: return position
+        return np.unravel_index(position, self.shape)
+    
+    @property
+    def loc(self):
+        """[LabelIndexer] Get and set items by property name(s)."""
+        return LabelIndexer(self)
     
     @property
     def value(self):
-        return np.array(self, float)
+        if self._shared_view is not None and not open_transactions:
+            return self._shared_view
+        if self._positions is not None:
+            dirty = self._dirty
+            if dirty:
+                index = np.fromiter(dirty, int, len(dirty))
+                dirty.clear()
+                self._buffer[index] = get_values(self.view(ndarray).ravel()[index])
+            return self._buffer_view
+        if not self._keep_snapshot: return get_values(self)
+        version = write_version[0]
+        if self._snapshot_version != version:
+            snapshot = get_values(self)
+            snapshot.flags.writeable = False
+            self._snapshot = snapshot
+            self._snapshot_version = version
+        return self._snapshot
+    
+    def refresh(self):
+        """Reevaluate the snapshot (or incremental buffer) of property values."""
+        self.invalidate()
+        if self._keep_snapshot or self._positions is not None: self.value
+    
+    def invalidate(self):
+        """Discard the snapshot of property values (or mark all properties
+        for reevaluation in incremental mode)."""
+        self._snapshot = None
+        self._snapshot_version = None
+        self.mark_dirty()
+    
+    def evaluate(self, executor=None, chunksize=None):
+        """
+        Return a float array of property values, evaluating chunks of
+        properties on an executor.
+        
+        Parameters
+        ----------
+        executor : concurrent.futures.Executor, optional
+            Thread or process pool to evaluate chunks on. If not given,
+            properties are evaluated serially.
+        chunksize : int, optional
+            Number of properties per chunk. Defaults to splitting
+            properties into 4 chunks per CPU.
+        
+        """
+        if executor is None: return self.value.copy()
+        version = write_version[0]
+        flat = self.view(ndarray).ravel()
+        size = flat.size
+        if not chunksize:
+            chunksize = -(-size // (4 * (os.cpu_count() or 1)))
+        chunksize = max(int(chunksize), 1)
+        chunks = [flat[i:i + chunksize] for i in range(0, size, chunksize)]
+        values = np.empty(size)
+        for i, chunk_values in zip(range(0, size, chunksize),
+                                   executor.map(get_values, chunks)):
+            values[i:i + chunksize] = chunk_values
+        values = values.reshape(self.shape)
+        if self._keep_snapshot and write_version[0] == version:
+            snapshot = values.copy()
+            snapshot.flags.writeable = False
+            self._snapshot = snapshot
+            self._snapshot_version = version
+        return values
+    
+    async def avalue(self, limit=None):
+        """Return property values, awaiting coroutine getters of all
+        properties concurrently (at most `limit` at a time). Properties
+        with regular getters are evaluated as in `value`."""
+        flat = self.view(ndarray).ravel()
+        coroutine = np.fromiter([i._afget is not None for i in flat], bool, flat.size)
+        if not coroutine.any(): return self.value.copy()
+        values = np.empty(flat.size)
+        regular = ~coroutine
+        if regular.any(): values[regular] = get_values(flat[regular])
+        values[coroutine] = await gather([i.avalue() for i in flat[coroutine]], limit)
+        return values.reshape(self.shape)
+    
+    async def aset(self, values, limit=None):
+        """Set property values, awaiting coroutine setters of all properties
+        concurrently (at most `limit` at a time). Properties with regular
+        setters are set as with `__setitem__`."""
+        flat = self.view(ndarray).ravel()
+        coroutine = np.fromiter([i._afset is not None for i in flat], bool, flat.size)
+        if not coroutine.any():
+            self[...] = values
+            return
+        values = np.broadcast_to(np.asarray(as_values(values), float), self.shape).ravel()
+        regular = ~coroutine
+        if regular.any(): set_values(flat[regular], values[regular])
+        await gather([i.aset(j) for i, j in zip(flat[coroutine], values[coroutine].tolist())], limit)
+    
+    def share(self):
+        """Return a SharedArray object with property values in shared memory,
+        which is sent to other processes without copying the values."""
+        return SharedArray(self.value)
+    
+    def __reduce__(self):
+        return (property_array, (self.view(ndarray), self._keep_snapshot,
+                                 self._positions is not None))
+    
+    def __array_ufunc__(self, ufunc, method, *inputs, out=None, **kwargs):
+        if method == 'at':
+            properties, *inputs = inputs
+            values = np.array(as_values(properties), float)
+            ufunc.at(values, *as_values(inputs), **kwargs)
+            if isa(properties, property_array): properties[...] = values
+            return
+        inputs = [as_values(i) for i in inputs]
+        if out:
+            values_out = tuple([np.empty(i.shape) if isa(i, property_array) else i
+                                for i in out])
+            kwargs['out'] = values_out
+        result = getattr(ufunc, method)(*inputs, **kwargs)
+        if not out: return result
+        for i, j in zip(out, values_out):
+            if isa(i, property_array): i[...] = j
+        return out[0] if len(out) == 1 else out
+    
+    def __array_function__(self, func, types, args, kwargs):
+        if func in inplace_functions and isa(args[0], property_array):
+            properties, *args = args
+            values = properties.value.copy()
+            result = func(values, *as_values(args),
+                          **{i: as_values(j) for i, j in kwargs.items()})
+            properties[...] = values
+            return result
+        out = kwargs.get('out')
+        if isa(out, property_array):
+            kwargs = {**kwargs, 'out': np.empty(out.shape)}
+        result = func(*as_values(args), **{i: as_values(j) for i, j in kwargs.items()})
+        if isa(out, property_array):
+            out[...] = kwargs['out']
+            return out
+        return result
     
     def all(self, *args, **kwargs):
-        return np.array(self, float).all(*args, **kwargs)
+        return self.value.all(*args, **kwargs)
     
     def any(self, *args, **kwargs):
-        return np.array(self, float).any(*args, **kwargs)
+        return self.value.any(*args, **kwargs)
     
     def copy(self):
-        return np.array(self, float)
+        return self.value.copy()
     
     def argmax(self, *args, **kwargs):
-        return np.array(self, float).argmax(*args, **kwargs)
+        return self.value.argmax(*args, **kwargs)
     
     def argmin(self, *args, **kwargs):
-        return np.array(self, float).argmin(*args, **kwargs)
+        return self.value.argmin(*args, **kwargs)
     
     def argpartition(self, *args, **kwargs):
-        return np.array(self, float).argpartition(*args, **kwargs)
+        return self.value.argpartition(*args, **kwargs)
     
     def argsort(self, *args, **kwargs):
-        return np.array(self, float).argsort(*args, **kwargs)
+        return self.value.argsort(*args, **kwargs)
     
     def choose(self, *args, **kwargs):
-        return np.array(self, float).choose(*args, **kwargs)
+        return self.value.choose(*args, **kwargs)
     
     def clip(self, *args, **kwargs):
-        return np.array(self, float).clip(*args, **kwargs)
+        return self.value.clip(*args, **kwargs)
     
     def conj(self):
-        return np.array(self, float).conj()
+        return self.value.conj()
     
     def conjugate(self):
-        return np.array(self, float).conjugate()
+        return self.value.conjugate()
     
     def cumprod(self, *args, **kwargs):
-        return np.array(self, float).cumprod(*args, **kwargs)
+        return self.value.cumprod(*args, **kwargs)
     
     def cumsum(self, *args, **kwargs):
-        return np.array(self, float).cumsum(*args, **kwargs)
+        return self.value.cumsum(*args, **kwargs)
     
     def dot(self, *args, **kwargs):
-        return np.array(self, float).dot(*args, **kwargs)
+        return self.value.dot(*args, **kwargs)
     
     def max(self, *args, **kwargs):
-        return np.array(self, float).max(*args, **kwargs)
+        return self.value.max(*args, **kwargs)
     
     def mean(self, *args, **kwargs):
-        return np.array(self, float).mean(*args, **kwargs)
+        return self.value.mean(*args, **kwargs)
     
     def min(self, *args, **kwargs):
-        return np.array(self, float).min(*args, **kwargs)
+        return self.value.min(*args, **kwargs)
     
     def nonzero(self, *args, **kwargs):
-        return np.array(self, float).nonzero(*args, **kwargs)
+        return self.value.nonzero(*args, **kwargs)
     
     def prod(self, *args, **kwargs):
-        return np.array(self, float).prod(*args, **kwargs)
+        return self.value.prod(*args, **kwargs)
     
     def ptp(self, *args, **kwargs):
-        return np.array(self, float).ptp(*args, **kwargs)
+        return self.value.ptp(*args, **kwargs)
     
     def put(self, *args, **kwargs):
-        return np.array(self, float).put(*args, **kwargs)
+        return self.value.copy().put(*args, **kwargs)
     
     def round(self, *args, **kwargs):
-        return np.array(self, float).round(*args, **kwargs)
+        return self.value.round(*args, **kwargs)
     
     def std(self, *args, **kwargs):
-        return np.array(self, float).std(*args, **kwargs)
+        return self.value.std(*args, **kwargs)
     
     def sum(self, *args, **kwargs):
-        return np.array(self, float).sum(*args, **kwargs)
+        return self.value.sum(*args, **kwargs)
     
     def trace(self, *args, **kwargs):
-        return np.array(self, float).trace(*args, **kwargs)
+        return self.value.trace(*args, **kwargs)
     
     def var(self, *args, **kwargs):
-        return np.array(self, float).var(*args, **kwargs)
+        return self.value.var(*args, **kwargs)
     
     def __getitem__(self, key):
         item = self.base[key]
         base = item.base
         if base is None:
-            return np.array(item, float)
+            return get_values(item)
         elif base.base is base: # Must be a free property
             return item.value
         else: # Must be a property array
-            return item.view(property_array)
+            array = item.view(property_array)
+            index = self._index
+            if index is not None and isa(key, slice) and self.ndim == 1:
+                positions, rows = index
+                array._index = (positions, rows[key])
+            return array
+    
+    def __contains__(self, item):
+        if isa(item, str):
+            positions, rows = self._name_index()
+            return positions.get(item, -1) in rows
+        return super().__contains__(item)
         
     def __setitem__(self, key, value):
         items = self.base[key]
-        if isa(items, ndarray):
-            for i, v in np.nditer((items, value), flags=('refs_ok', 'zerosize_ok')):
-                i.item().value = v 
+        if isa(value, property_array): value = value.value
+        shared_view = self._shared_view
+        if shared_view is not None and not open_transactions:
+            shared_view[key] = value
+            write_version[0] += 1
+            if write_observers:
+                notify_write(items.ravel() if isa(items, ndarray) else (items,))
+        elif isa(items, ndarray):
+            set_values(items, value)
         else:
             items.value = value
     
     def __add__(self, other):
-        return np.array(self, float) + other
+        return self.value + as_values(other)
     
     def __sub__(self, other):
-        return np.array(self, float) - other
+        return self.value - as_values(other)
     
     def __mul__(self, other):
-        return np.array(self, float) * other
+        return self.value * as_values(other)
     
     def __matmul__(self, other):
-        return np.array(self, float) @ other
+        return self.value @ as_values(other)
     
     def __truediv__(self, other):
-        return np.array(self, float) / other
+        return self.value / as_values(other)
     
     def __floordiv__(self, other):
-        return np.array(self, float) // other
+        return self.value // as_values(other)
     
     def __mod__(self, other):
-        return np.array(self, float) % other
+        return self.value % as_values(other)
     
     def __pow__(self, other):
-        return np.array(self, float) ** other
+        return self.value ** as_values(other)
     
     def __lshift__(self, other):
-        return np.array(self, float) << other
+        return self.value << as_values(other)
     
     def __rshift__(self, other):
-        return np.array(self, float) >> other
+        return self.value >> as_values(other)
     
     def __and__(self, other): 
-        return np.array(self, float) & other
+        return self.value & as_values(other)
     
     def __xor__(self, other): 
-        return np.array(self, float) ^ other
+        return self.value ^ as_values(other)
     
     def __or__(self, other):
-        return np.array(self, float) | other
+        return self.value | as_values(other)
     
     def __radd__(self, other):
-        return other + np.array(self, float)
+        return as_values(other) + self.value
     
     def __rsub__(self, other):
-        return other - np.array(self, float)
+        return as_values(other) - self.value
     
     def __rmul__(self, other):
-        return other * np.array(self, float)
+        return as_values(other) * self.value
     
     def __rmatmul__(self, other):
-        return other @ np.array(self, float)
+        return as_values(other) @ self.value
     
     def __rtruediv__(self, other):
-        return other / np.array(self, float)
+        return as_values(other) / self.value
     
     def __rfloordiv__(self, other):
-        return other // np.array(self, float)
+        return as_values(other) // self.value
     
     def __rmod__(self, other):
-        return other % np.array(self, float)
+        return as_values(other) % self.value
     
     def __rpow__(self, other):
-        return other ** np.array(self, float)
+        return as_values(other) ** self.value
     
     def __rlshift__(self, other):
-        return other << np.array(self, float) 
+        return as_values(other) << self.value 
     
     def __rrshift__(self, other):
-        return other >> np.array(self, float)
+        return as_values(other) >> self.value
     
     def __rand__(self, other):
-        return other & np.array(self, float)
+        return as_values(other) & self.value
     
     def __rxor__(self, other):
-        return other ^ np.array(self, float)
+        return as_values(other) ^ self.value
     
     def __ror__(self, other):
-        return other | np.array(self, float)
+        return as_values(other) | self.value
     
     def __iadd__(self, other):
-        self[:] = np.array(self, float) + other
+        self[:] = self.value + as_values(other)
         return self
     
     def __isub__(self, other): 
-        self[:] = np.array(self, float) - other
+        self[:] = self.value - as_values(other)
         return self
     
     def __imul__(self, other): 
-        self[:] = np.array(self, float) * other
+        self[:] = self.value * as_values(other)
         return self
     
     def __imatmul__(self, other):
         raise TypeError("in-place matrix multiplication is not (yet) supported")
     
     def __itruediv__(self, other): 
-        self[:] = np.array(self, float) / other
+        self[:] = self.value / as_values(other)
         return self
     
     def __ifloordiv__(self, other):
-        self[:] = np.array(self, float) // other
+        self[:] = self.value // as_values(other)
         return self
     
     def __imod__(self, other): 
-        self[:] =np.array(self, float) % other
+        self[:] = self.value % as_values(other)
         return self
     
     def __ipow__(self, other):
-        self[:] = np.array(self, float) ** other
+        self[:] = self.value ** as_values(other)
         return self
     
     def __ilshift__(self, other):
-        self[:] = np.array(self, float) << other
+        self[:] = self.value << as_values(other)
         return self
     
     def __irshift__(self, other):
-        self[:] = np.array(self, float) >> other
+        self[:] = self.value >> as_values(other)
         return self
     
     def __iand__(self, other): 
-        self[:] = np.array(self, float) & other
+        self[:] = self.value & as_values(other)
         return self
     
     def __ixor__(self, other): 
-        self[:] = np.array(self, float) ^ other
+        self[:] = self.value ^ as_values(other)
         return self
     
     def __ior__(self, other):
-        self[:] = np.array(self, float) | other
+        self[:] = self.value | as_values(other)
         return self
 
     def __repr__(self):
@@ -4,15 +4,26 @@ Created on Fri Jan 18 14:18:27 2019
 
 @author: Guest Group
 """
-from ._free_property import metaProperty, FreeProperty
+from ._free_property import (metaProperty, FreeProperty, cached_getter,
+                             versioned_setter, slot_methods,
+                             is_coroutine_function, synchronous_getter,
+                             synchronous_setter)
+from weakref import WeakValueDictionary
 
 __all__ = ('PropertyFactory',)
 
+# %% Interned classes
+
+#: dict[tuple, metaProperty] Classes created by the PropertyFactory by their
+#: defining arguments. Unused classes are garbage collected.
+interned_classes = WeakValueDictionary()
+
 # %% Property Factory
 
 
 def PropertyFactory(fget=None, fset=None, clsname=None, doc=None, units=None,
-                    slots=None):
+                    slots=None, fget_many=None, fset_many=None, cache=False,
+                    depends=None, intern=True):
     """Create an FreeProperty subclass with getter and setter functions.
     
     Parameters
@@ -36,6 +47,31 @@ def PropertyFactory(fget=None, fset=None, clsname=None, doc=None, units=None,
     slots : tuple[str], optional
         Slots for class.
     
+    fget_many : function, optional
+        Should return an array of values given a 1d object array of
+        instances. If given, property_array objects evaluate all instances
+        of the class in a single call.
+    
+    fset_many : function, optional
+        Should set the values of a 1d object array of instances given a
+        float array of the same size. If given, setting items of
+        property_array objects (including in-place operations) sets all
+        instances of the class in a single call.
+    
+    cache : bool, optional
+        Whether to store the last value of instances and reuse it until the
+        setter runs (or any of the `depends` data changes). Defaults to False.
+    
+    depends : tuple[str], optional
+        Keys of the instance data the getter depends on. Cached values are
+        invalidated whenever the data at these keys changes. Mutable data
+        (e.g. arrays) is copied at each evaluation, so in-place changes are
+        detected too.
+    
+    intern : bool, optional
+        Whether to return the same class for the same (hashable) arguments.
+        Defaults to True.
+    
     Examples
     --------
     
@@ -125,18 +161,159 @@ def PropertyFactory(fget=None, fset=None, clsname=None, doc=None, units=None,
         <Water: 3000 kg>
         >>> water_data  # The change also affects the original data
         {'rho': 1000, 'vol': 3.0}
+    
+    Batch getters and setters may be added to evaluate and set many
+    instances at once (e.g. through a property_array) with a single call:
+    
+    .. code-block:: python
+    
+        >>> import numpy as np
+        >>> @Weight.getter_many
+        >>> def Weight(weights):
+        ...    rho = np.array([i.data['rho'] for i in weights])
+        ...    vol = np.array([i.data['vol'] for i in weights])
+        ...    return rho * vol
+        >>>
+        >>> @Weight.setter_many
+        >>> def Weight(weights, values):
+        ...    for i, weight in zip(weights, values):
+        ...        data = i.data
+        ...        data['vol'] = weight / data['rho']
+    
+    Expensive getters can be cached. Cached values are reused until the
+    setter runs or the data the getter depends on changes:
+    
+    .. code-block:: python
+    
+        >>> @PropertyFactory(units='kg', cache=True, depends=('rho', 'vol'))
+        >>> def Weight(self):
+        ...    data = self.data
+        ...    return data['rho'] * data['vol']
+        >>>
+        >>> weight_water = Weight('Water', {'rho': 1000, 'vol': 3})
+        >>> weight_water + weight_water
+        6000
+        >>> weight_water.data['vol'] = 4
+        >>> weight_water.value
+        4000
+        >>> Weight.cache_info()
+        CacheInfo(hits=1, misses=2)
+    
+    Getters and setters may be coroutine functions (`async def`). Their
+    values are awaited with `avalue` and `aset` (or computed synchronously
+    through `value` outside of a running event loop):
+    
+    .. code-block:: python
+    
+        >>> import asyncio
+        >>> @PropertyFactory(units='kg')
+        >>> async def RemoteWeight(self):
+        ...    await asyncio.sleep(0.1) # e.g. fetch data from a server
+        ...    return self.data['weight']
+        >>>
+        >>> remote_weight = RemoteWeight('Water', {'weight': 3000})
+        >>> asyncio.run(remote_weight.avalue())
+        3000
+        >>> remote_weight.value
+        3000
+    
+    Many instances can be created at once from columns of slot values
+    (names and data by default):
+    
+    .. code-block:: python
+    
+        >>> weights = Weight.from_columns(['Water', 'Ethanol'],
+        ...                               [{'rho': 1000, 'vol': 3},
+        ...                                {'rho': 789, 'vol': 3}],
+        ...                               array=True)
+        >>> weights
+        property_array([3000, 2367])
+    
+    .. Note::
+    
+       Classes created in functions (or in the main script) are pickled
+       along with their getters and setters, so instances can be sent to
+       process pools wherever the classes are not importable.
+    
+    Classes are interned: calling the PropertyFactory again with the same
+    arguments returns the same class instead of creating a new one. Classes
+    modified after creation (e.g. with `setter` or by setting `units`) are
+    no longer returned by later calls:
+    
+    .. code-block:: python
+    
+        >>> def getter(self):
+        ...    data = self.data
+        ...    return data['rho'] * data['vol']
+        >>>
+        >>> Weight = PropertyFactory(getter, clsname='Weight', units='kg')
+        >>> Weight is PropertyFactory(getter, clsname='Weight', units='kg')
+        True
+        >>> Weight is PropertyFactory(getter, clsname='Weight', units='g')
+        False
+        >>> Weight.units = 'g'
+        >>> Weight is PropertyFactory(getter, clsname='Weight', units='g')
+        False
             
     """       
     if not fget:
-        return lambda fget: PropertyFactory(fget, fset, clsname, doc, units, slots)
+        return lambda fget: PropertyFactory(fget, fset, clsname, doc, units,
+                                            slots, fget_many, fset_many,
+                                            cache, depends, intern)
         
+    arguments = {'fget': fget, 'fset': fset, 'clsname': clsname, 'doc': doc,
+                 'units': units, 'slots': slots, 'fget_many': fget_many,
+                 'fset_many': fset_many, 'cache': cache, 'depends': depends,
+                 'intern': intern}
+    
     # Defaults
     if clsname is None: clsname = fget.__name__
     if doc     is None: doc     = fget.__doc__
+    slots = tuple(slots or ('name', 'data'))
+    depends = tuple(depends or ())
+    
+    if intern:
+        key = (fget, fset, clsname, doc, units, slots,
+               fget_many, fset_many, bool(cache), depends)
+        try:
+            cls = interned_classes.get(key)
+        except TypeError: # Unhashable arguments are not interned
+            key = None
+        else:
+            if cls is not None: return cls
+    else:
+        key = None
+    module = fget.__module__
+    afget = afset = None
+    if is_coroutine_function(fget):
+        afget = fget
+        fget = synchronous_getter(fget)
+    if is_coroutine_function(fset):
+        afset = fset
+        fset = synchronous_setter(fset)
+    
+    if cache:
+        if '_cache' not in slots: slots = (*slots, '_cache')
+        fget = cached_getter(fget, depends)
+    if fset: fset = versioned_setter(fset, cache)
+    __init__, from_columns = slot_methods(slots)
     
     definitions = {'__doc__': doc,
-                   '__slots__': slots or ('name', 'data'),
-                   '__module__': fget.__module__,
+                   '__slots__': slots,
+                   '__init__': __init__,
+                   '_from_columns': from_columns,
+                   '__module__': module,
                    '_units': units,
+                   '_fget_many': fget_many,
+                   '_fset_many': fset_many,
+                   '_afget': afget,
+                   '_afset': afset,
+                   '_cached': bool(cache),
+                   '_depends': depends,
+                   '_cache_stats': [0, 0],
+                   '_factory_arguments': arguments,
+                   '_interned_key': key,
                    'value': property(fget, fset)}        
-    return metaProperty(clsname, (FreeProperty,), definitions)
+    cls = metaProperty(clsname, (FreeProperty,), definitions)
+    if key is not None: interned_classes[key] = cls
+    return cls
@@ -0,0 +1,370 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 10:55:19 2026
+
+@author: yoelr
+"""
+import numpy as np
+from ._free_property import data_changed
+from ._property_array import property_array, as_values
+from ._column_store import ColumnRow, ColumnSelection
+
+__all__ = ('PropertyTable',)
+
+# %% Property tables
+
+class PropertyTable:
+    """
+    Create a compact table of properties of a single FreeProperty class
+    (e.g. created with the PropertyFactory) with data held in rows of a
+    ColumnStore object. Properties are represented by row numbers instead
+    of Python objects; FreeProperty objects are only created when
+    requested. Like a property_array, indexing returns property values,
+    setting items sets property values, and arithmetic and reductions
+    operate on property values.
+
+    Parameters
+    ----------
+        cls : FreeProperty subclass
+        store : ColumnStore
+        names : Sequence[str], optional
+            Names of properties of all rows. Defaults to the names loaded
+            with the store (or row numbers).
+        vectorize : bool, optional
+            Whether the getter and setter of `cls` work elementwise on arrays
+            of data (e.g. ``data['rho'] * data['vol']``), in which case they
+            are called once with columns of all rows. Otherwise, they are
+            called once for each row. Defaults to True.
+
+    Examples
+    --------
+    Create a table of weights of a million rows:
+
+    .. code-block:: python
+
+        >>> import numpy as np
+        >>> from free_properties import PropertyFactory, ColumnStore, PropertyTable
+        >>> @PropertyFactory(units='kg')
+        >>> def Weight(self):
+        ...    '''Weight (kg) based on volume (m^3).'''
+        ...    data = self.data
+        ...    return data['rho'] * data['vol']
+        >>>
+        >>> @Weight.setter
+        >>> def Weight(self, weight):
+        ...    data = self.data
+        ...    data['vol'] = weight / data['rho']
+        >>>
+        >>> store = ColumnStore(rho=np.full(10**6, 1000.), vol=np.ones(10**6))
+        >>> weights = PropertyTable(Weight, store)
+        >>> weights.sum()
+        1000000000.0
+
+    Index, set, and select properties like a property_array:
+
+    .. code-block:: python
+
+        >>> weights[0]
+        1000.0
+        >>> weights[:2] = [2000, 3000]
+        >>> weights[:3]
+        array([2000., 3000., 1000.])
+        >>> store['vol'][:3]
+        array([2., 3., 1.])
+        >>> weights.select(slice(2)).mean()
+        2500.0
+
+    FreeProperty objects are created on demand:
+
+    .. code-block:: python
+
+        >>> weights.get_property(1)
+        <1: 3000 kg>
+
+    .. Note::
+
+       Tables call the getter and setter of `cls` as defined, ignoring
+       profilers, tracers, frozen scopes, and transactions. Table values
+       are not memoized by frozen scopes, and table writes are not
+       buffered by transactions (they are applied right away).
+
+    """
+    __slots__ = ('cls', 'store', 'names', 'vectorize', '_rows', '_index')
+
+    def __init__(self, cls, store, names=None, vectorize=True):
+        self.cls = cls
+        self.store = store
+        self.names = store.names if names is None else names
+        self.vectorize = vectorize
+        self._rows = None # All rows
+        self._index = None
+
+    @property
+    def rows(self):
+        """[ndarray[int]] Rows of the store in the table."""
+        rows = self._rows
+        return np.arange(self.store.size) if rows is None else rows
+
+    @property
+    def size(self):
+        rows = self._rows
+        return self.store.size if rows is None else rows.size
+
+    @property
+    def shape(self):
+        return (self.size,)
+
+    def _proxy(self, data):
+        """Return a FreeProperty object of the table's class with the given data."""
+        proxy = self.cls.__new__(self.cls)
+        proxy.name = None
+        proxy.data = data
+        return proxy
+
+    def _data(self):
+        """Return the columns of all rows in the table."""
+        rows = self._rows
+        return self.store if rows is None else ColumnSelection(self.store, rows)
+
+    def _new(self, row):
+        """Return a FreeProperty object with data at a row of the store."""
+        names = self.names
+        name = str(row) if names is None else str(names[row])
+        return self.cls(name, ColumnRow(self.store, row))
+
+    def index(self, name):
+        """Return the row of the store of the property with the given name."""
+        index = self._index
+        if index is None:
+            names = self.names
+            if names is None:
+                index = {str(i): i for i in range(self.store.size)}
+            else:
+                index = {str(j): i for i, j in enumerate(names)}
+            self._index = index
+        try:
+            return index[name]
+        except KeyError:
+            raise KeyError(f'no property named {repr(name)}') from None
+
+    def _row_indices(self, key):
+        """Return the rows of the store selected by `key`."""
+        if isinstance(key, str):
+            return self.index(key)
+        elif isinstance(key, (list, tuple)) and key and isinstance(key[0], str):
+            return np.array([self.index(i) for i in key], int)
+        rows = self._rows
+        if rows is None:
+            if isinstance(key, (int, np.integer)):
+                size = self.store.size
+                if not -size <= key < size:
+                    raise IndexError(f'index {key} is out of bounds for table with {size} rows')
+                return int(key) + size if key < 0 else int(key)
+            elif isinstance(key, slice):
+                return np.arange(*key.indices(self.store.size))
+            rows = np.arange(self.store.size)
+        return rows[key]
+
+    def select(self, key):
+        """Return a PropertyTable object of properties selected by `key`
+        (an index, slice, mask, or names)."""
+        table = PropertyTable.__new__(PropertyTable)
+        table.cls = self.cls
+        table.store = self.store
+        table.names = self.names
+        table.vectorize = self.vectorize
+        table._rows = np.atleast_1d(self._row_indices(key))
+        table._index = self._index
+        return table
+
+    def get_property(self, key):
+        """Return a FreeProperty object of the property at `key` (an index
+        or name) with a ColumnRow object as data."""
+        row = self._row_indices(key)
+        if not isinstance(row, (int, np.integer)):
+            raise TypeError('key must be an index or name')
+        return self._new(int(row))
+
+    def to_array(self):
+        """Return a property_array of FreeProperty objects of all properties."""
+        new = self._new
+        rows = self.rows
+        properties = np.empty(rows.size, object)
+        for i, j in enumerate(rows.tolist()): properties[i] = new(j)
+        return property_array(properties)
+
+    @property
+    def value(self):
+        """[ndarray] Values of all properties."""
+        fget = self.cls._uninstrumented_value().fget
+        shape = self.shape
+        if self.vectorize:
+            values = np.asarray(fget(self._proxy(self._data())), float)
+            if values.shape != shape: values = np.broadcast_to(values, shape).copy()
+            return values
+        # A proxy for each row, as getters may cache values by instance
+        proxy = self._proxy
+        store = self.store
+        values = np.empty(shape)
+        for i, j in enumerate(self.rows.tolist()):
+            values[i] = fget(proxy(ColumnRow(store, j)))
+        return values
+
+    @value.setter
+    def value(self, values):
+        cls = self.cls
+        fset = cls._uninstrumented_value().fset
+        if fset is None: raise AttributeError(f"can't set value of {cls.__name__} objects")
+        values = np.broadcast_to(np.asarray(as_values(values), float), self.shape)
+        if self.vectorize:
+            fset(self._proxy(self._data()), values)
+        else:
+            proxy = self._proxy
+            store = self.store
+            for i, j in zip(self.rows.tolist(), values.tolist()):
+                fset(proxy(ColumnRow(store, i)), j)
+        if cls._cached: cls._cache_epoch += 1
+        data_changed()
+
+    def __array__(self, dtype=None, copy=None):
+        values = self.value
+        return values if dtype is None else values.astype(dtype)
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        new = self._new
+        for i in self.rows.tolist(): yield new(i)
+
+    def __contains__(self, name):
+        try: self.index(name)
+        except KeyError: return False
+        else: return True
+
+    def __getitem__(self, key):
+        rows = self._row_indices(key)
+        if isinstance(rows, (int, np.integer)):
+            return self._new(int(rows)).value
+        return self.select(key).value
+
+    def __setitem__(self, key, values):
+        self.select(key).value = values
+
+    def all(self, *args, **kwargs):
+        return self.value.all(*args, **kwargs)
+
+    def any(self, *args, **kwargs):
+        return self.value.any(*args, **kwargs)
+
+    def argmax(self, *args, **kwargs):
+        return self.value.argmax(*args, **kwargs)
+
+    def argmin(self, *args, **kwargs):
+        return self.value.argmin(*args, **kwargs)
+
+    def cumsum(self, *args, **kwargs):
+        return self.value.cumsum(*args, **kwargs)
+
+    def max(self, *args, **kwargs):
+        return self.value.max(*args, **kwargs)
+
+    def mean(self, *args, **kwargs):
+        return self.value.mean(*args, **kwargs)
+
+    def min(self, *args, **kwargs):
+        return self.value.min(*args, **kwargs)
+
+    def prod(self, *args, **kwargs):
+        return self.value.prod(*args, **kwargs)
+
+    def std(self, *args, **kwargs):
+        return self.value.std(*args, **kwargs)
+
+    def sum(self, *args, **kwargs):
+        return self.value.sum(*args, **kwargs)
+
+    def var(self, *args, **kwargs):
+        return self.value.var(*args, **kwargs)
+
+    def __add__(self, other):
+        return self.value + as_values(other)
+
+    def __sub__(self, other):
+        return self.value - as_values(other)
+
+    def __mul__(self, other):
+        return self.value * as_values(other)
+
+    def __truediv__(self, other):
+        return self.value / as_values(other)
+
+    def __floordiv__(self, other):
+        return self.value // as_values(other)
+
+    def __mod__(self, other):
+        return self.value % as_values(other)
+
+    def __pow__(self, other):
+        return self.value ** as_values(other)
+
+    def __radd__(self, other):
+        return as_values(other) + self.value
+
+    def __rsub__(self, other):
+        return as_values(other) - self.value
+
+    def __rmul__(self, other):
+        return as_values(other) * self.value
+
+    def __rtruediv__(self, other):
+        return as_values(other) / self.value
+
+    def __rfloordiv__(self, other):
+        return as_values(other) // self.value
+
+    def __rmod__(self, other):
+        return as_values(other) % self.value
+
+    def __rpow__(self, other):
+        return as_values(other) ** self.value
+
+    def __iadd__(self, other):
+        self.value = self.value + as_values(other)
+        return self
+
+    def __isub__(self, other):
+        self.value = self.value - as_values(other)
+        return self
+
+    def __imul__(self, other):
+        self.value = self.value * as_values(other)
+        return self
+
+    def __itruediv__(self, other):
+        self.value = self.value / as_values(other)
+        return self
+
+    def __neg__(self):
+        return -self.value
+
+    def __pos__(self):
+        return +self.value
+
+    def __abs__(self):
+        return abs(self.value)
+
+    def __lt__(self, other):
+        return self.value < as_values(other)
+
+    def __le__(self, other):
+        return self.value <= as_values(other)
+
+    def __gt__(self, other):
+        return self.value > as_values(other)
+
+    def __ge__(self, other):
+        return self.value >= as_values(other)
+
+    def __repr__(self):
+        return f"<{type(self).__name__}: {self.cls.__name__} ({self.size} rows)>"
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 10:59:41 2026
+
+@author: yoelr
+"""
+import os
+import numpy as np
+from multiprocessing import shared_memory
+
+__all__ = ('SharedArray',)
+
+# %% Shared memory
+
+class SharedMemory(shared_memory.SharedMemory):
+    # Arrays of the memory may outlive the handle but do not prevent closing
+    # (and unmapping) it, so only the file descriptor is closed. The memory
+    # is unmapped once all arrays referencing the mapping are collected.
+    def __del__(self):
+        fd = getattr(self, '_fd', -1)
+        if fd >= 0:
+            os.close(fd)
+            self._fd = -1
+
+
+class SharedArray:
+    """
+    Create a copy of an array in shared memory. SharedArray objects are
+    pickled as a reference to the shared memory block, so that processes
+    receiving them (e.g. workers of a process pool) attach to the same
+    memory instead of receiving a copy of the data.
+
+    Parameters
+    ----------
+        array : array_like
+
+    Examples
+    --------
+    Share the values of a property_array with process pool workers:
+
+    .. code-block:: python
+
+        >>> from free_properties import PropertyFactory, property_array
+        >>> @PropertyFactory(units='kg')
+        >>> def Weight(self):
+        ...    data = self.data
+        ...    return data['rho'] * data['vol']
+        >>>
+        >>> prop_arr = property_array([Weight('Water', {'rho': 1000, 'vol': 3}),
+        ...                            Weight('Ethanol', {'rho': 789, 'vol': 3})])
+        >>> shared = prop_arr.share()
+        >>> shared.array
+        array([3000., 2367.])
+        >>> from concurrent.futures import ProcessPoolExecutor
+        >>> def total(shared):
+        ...     return shared.array.sum()
+        >>>
+        >>> with ProcessPoolExecutor(2) as executor:
+        ...     totals = list(executor.map(total, [shared, shared]))
+        >>> totals
+        [5367.0, 5367.0]
+        >>> shared.unlink() # Free the memory block once all processes are done
+
+    """
+    __slots__ = ('array', '_memory')
+
+    def __init__(self, array):
+        array = np.asarray(array)
+        memory = SharedMemory(create=True, size=max(array.nbytes, 1))
+        self.array = np.ndarray(array.shape, array.dtype, memory.buf)
+        self.array[...] = array
+        self._memory = memory
+
+    @classmethod
+    def attach(cls, name, shape, dtype):
+        """Return a SharedArray object of an existing shared memory block."""
+        self = cls.__new__(cls)
+        self._memory = memory = SharedMemory(name)
+        self.array = np.ndarray(shape, dtype, memory.buf)
+        return self
+
+    @property
+    def name(self):
+        """[str] Name of the shared memory block."""
+        return self._memory.name
+
+    def unlink(self):
+        """Request the shared memory block to be freed once all processes
+        release it. Call this once (e.g. in the process that created it)."""
+        self._memory.unlink()
+
+    def __reduce__(self):
+        array = self.array
+        return (SharedArray.attach, (self.name, array.shape, array.dtype.str))
+
+    def __repr__(self):
+        return f"<{type(self).__name__}: {self.name} {self.array.shape} {self.array.dtype}>"
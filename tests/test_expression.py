@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 11:36:12 2026
+
+@author: yoelr
+"""
+from free_properties import PropertyFactory, FreeProperty, Expression, lazy
+
+@PropertyFactory(units='kg')
+def Weight(self):
+    data = self.data
+    return data['rho'] * data['vol']
+
+@Weight.setter
+def Weight(self, weight):
+    data = self.data
+    data['vol'] = weight / data['rho']
+
+class Custom(FreeProperty):
+    __slots__ = ('name', 'data')
+
+    def __init__(self, name, data):
+        self.name = name
+        self.data = data
+
+    @property
+    def value(self):
+        return self.data[0]
+
+    @value.setter
+    def value(self, value):
+        self.data[0] = value
+
+def test_property_operand_of_expression_is_deferred():
+    water_data = {'rho': 1000, 'vol': 3}
+    water = Weight('Water', water_data)
+    ethanol = Weight('Ethanol', {'rho': 789, 'vol': 3})
+    for expr in (water + lazy(ethanol), water * lazy(ethanol),
+                 water - lazy(ethanol) / 2):
+        assert isinstance(expr, Expression)
+        assert water in expr.variables
+    expr = water + lazy(ethanol)
+    assert expr.evaluate() == 5367
+    water_data['vol'] = 4
+    assert expr.evaluate() == 6367
+
+def test_custom_property_operand_of_expression_is_deferred():
+    data = [2.]
+    prop = Custom('prop', data)
+    expr = prop ** lazy(Custom('other', [3.]))
+    assert prop in expr.variables
+    data[0] = 3.
+    assert expr.evaluate() == 27.
+
+def test_inplace_operation_with_expression_is_deferred():
+    water_data = {'rho': 1000, 'vol': 3}
+    water = Weight('Water', water_data)
+    ethanol = Weight('Ethanol', {'rho': 789, 'vol': 3})
+    prop = water
+    prop += lazy(ethanol)
+    assert isinstance(prop, Expression)
+    assert water_data['vol'] == 3
+    assert prop.evaluate() == 5367
+
+def test_property_operands_are_not_deferred():
+    water = Weight('Water', {'rho': 1000, 'vol': 3})
+    ethanol = Weight('Ethanol', {'rho': 789, 'vol': 3})
+    assert water + ethanol == 5367
+    assert water + 1 == 3001
+    assert 1 + water == 3001